@@ -1,37 +1,128 @@
-import pandas as pd
-import yfinance as yf
+import asyncio
+import json
+import os
+import time
+
+import aiohttp
+
+# Yahoo quoteSummary 엔드포인트 (yf.Ticker(symbol).info 대신 직접 호출)
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}?modules=price"
+
+# 동시 요청 수 제한 (Yahoo 측 부하 및 메모리 사용량 제어)
+MAX_CONCURRENT_REQUESTS = 16
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 나스닥 100 ETF (QQQ)의 구성종목을 통해 얻거나, 직접 리스트를 사용
+# (호출마다 리스트를 재생성하지 않도록 모듈 상수로 고정)
+NASDAQ100_SYMBOLS = (
+    'AAPL', 'MSFT', 'AMZN', 'NVDA', 'GOOGL', 'GOOG', 'META', 'TSLA', 'AVGO', 'COST',
+    'NFLX', 'TMUS', 'ASML', 'ADBE', 'PEP', 'LIN', 'CSCO', 'TXN', 'QCOM', 'INTU',
+    'AMAT', 'CMCSA', 'HON', 'AMGN', 'VRTX', 'AMD', 'SBUX', 'GILD', 'ADP', 'ISRG',
+    'MU', 'INTC', 'ADI', 'LRCX', 'MDLZ', 'PYPL', 'REGN', 'BKNG', 'KLAC', 'MELI',
+    'CSX', 'SNPS', 'CDNS', 'MAR', 'ORLY', 'MRVL', 'FTNT', 'CRWD', 'ADSK', 'NXPI',
+    'ROP', 'WDAY', 'ABNB', 'MNST', 'CHTR', 'TTD', 'TEAM', 'AEP', 'FAST', 'ROST',
+    'KDP', 'ODFL', 'BZ', 'VRSK', 'EXC', 'DDOG', 'XEL', 'KHC', 'CTSH', 'GEHC',
+    'LULU', 'CCEP', 'ON', 'DXCM', 'BIIB', 'ANSS', 'ZS', 'IDXX', 'CTAS', 'TTWO',
+    'WBD', 'GFS', 'ILMN', 'MRNA', 'PCAR', 'EA', 'CDW', 'SGEN', 'ALGN', 'LCID',
+    'WBA', 'ENPH', 'DLTR', 'SIRI', 'MTCH', 'PAYX', 'EBAY', 'JD', 'RIVN', 'ZM'
+)
+
+# O(1) 멤버십 확인용 (일괄 수집 결과의 티커 필터링 등)
+NASDAQ100_SET = frozenset(NASDAQ100_SYMBOLS)
+
+# 회사명 디스크 캐시 (나스닥 100 구성은 거의 바뀌지 않으므로 긴 TTL 사용)
+CACHE_FILE = os.path.join('.cache', 'nasdaq100_names.json')
+CACHE_TTL = 7 * 24 * 3600  # 7일
+
+
+def _load_name_cache() -> dict:
+    """디스크 캐시를 로드합니다. 없거나 손상된 경우 빈 딕셔너리 반환."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_name_cache(cache: dict):
+    """디스크 캐시를 원자적으로 저장합니다 (tmp 파일 작성 후 rename)."""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp_file = CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        pass  # 캐시 저장 실패는 치명적이지 않음
+
+
+async def _fetch_name(session: aiohttp.ClientSession, symbol: str, semaphore: asyncio.Semaphore) -> str:
+    """Yahoo quoteSummary API에서 회사명(longName, 없으면 shortName)을 비동기로 가져옵니다."""
+    async with semaphore:
+        async with session.get(QUOTE_SUMMARY_URL.format(symbol=symbol)) as response:
+            data = await response.json()
+            price = data['quoteSummary']['result'][0]['price']
+            # longName이 비어 있는 티커는 shortName으로 대체 (추가 왕복 없이 해결)
+            return price.get('longName') or price.get('shortName') or symbol
+
+
+async def _fetch_all_names(symbols) -> dict:
+    """모든 심볼의 회사명을 동시 요청으로 수집합니다 (세마포어로 동시성 제한)."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        tasks = [_fetch_name(session, symbol, semaphore) for symbol in symbols]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 예상 가능한 오류(네트워크/응답 형식)만 심볼명으로 대체하고, 그 외는 전파
+    company_names = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError, KeyError, IndexError, TypeError, ValueError)):
+            print(f"⚠️  {symbol} 회사명 조회 실패: {result}")
+            company_names[symbol] = symbol
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            company_names[symbol] = result
+
+    return company_names
+
 
 def get_nasdaq100_companies():
     """
     나스닥 100 기업 목록을 가져옵니다.
     """
-    # 나스닥 100 ETF (QQQ)의 구성종목을 통해 얻거나, 직접 리스트를 사용
-    nasdaq100_symbols = [
-        'AAPL', 'MSFT', 'AMZN', 'NVDA', 'GOOGL', 'GOOG', 'META', 'TSLA', 'AVGO', 'COST',
-        'NFLX', 'TMUS', 'ASML', 'ADBE', 'PEP', 'LIN', 'CSCO', 'TXN', 'QCOM', 'INTU',
-        'AMAT', 'CMCSA', 'HON', 'AMGN', 'VRTX', 'AMD', 'SBUX', 'GILD', 'ADP', 'ISRG',
-        'MU', 'INTC', 'ADI', 'LRCX', 'MDLZ', 'PYPL', 'REGN', 'BKNG', 'KLAC', 'MELI',
-        'CSX', 'SNPS', 'CDNS', 'MAR', 'ORLY', 'MRVL', 'FTNT', 'CRWD', 'ADSK', 'NXPI',
-        'ROP', 'WDAY', 'ABNB', 'MNST', 'CHTR', 'TTD', 'TEAM', 'AEP', 'FAST', 'ROST',
-        'KDP', 'ODFL', 'BZ', 'VRSK', 'EXC', 'DDOG', 'XEL', 'KHC', 'CTSH', 'GEHC',
-        'LULU', 'CCEP', 'ON', 'DXCM', 'BIIB', 'ANSS', 'ZS', 'IDXX', 'CTAS', 'TTWO',
-        'WBD', 'GFS', 'ILMN', 'MRNA', 'PCAR', 'EA', 'CDW', 'SGEN', 'ALGN', 'LCID',
-        'WBA', 'ENPH', 'DLTR', 'SIRI', 'MTCH', 'PAYX', 'EBAY', 'JD', 'RIVN', 'ZM'
-    ]
-    
-    # 회사명 매핑 딕셔너리
-    company_names = {}
-    
     print("나스닥 100 기업 정보를 가져오는 중...")
-    for symbol in nasdaq100_symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            company_names[symbol] = info.get('longName', symbol)
-        except:
-            company_names[symbol] = symbol
-    
-    return nasdaq100_symbols, company_names
+
+    # 디스크 캐시에서 유효한(TTL 이내) 항목을 먼저 사용
+    now = time.time()
+    cache = _load_name_cache()
+    company_names = {}
+    missing_symbols = []
+
+    for symbol in NASDAQ100_SYMBOLS:
+        entry = cache.get(symbol)
+        if entry and now - entry.get('ts', 0) < CACHE_TTL:
+            company_names[symbol] = entry['name']
+        else:
+            missing_symbols.append(symbol)
+
+    # 캐시에 없거나 만료된 심볼만 비동기 동시 요청으로 수집
+    if missing_symbols:
+        fetched = asyncio.run(_fetch_all_names(missing_symbols))
+        company_names.update(fetched)
+
+        for symbol, name in fetched.items():
+            # 조회 실패(심볼 그대로 반환)는 캐시하지 않고 다음 실행에서 재시도
+            if name != symbol:
+                cache[symbol] = {'name': name, 'ts': now}
+        _save_name_cache(cache)
+
+    return NASDAQ100_SYMBOLS, company_names
 
 if __name__ == "__main__":
     symbols, names = get_nasdaq100_companies()
@@ -1,10 +1,36 @@
+import asyncio
+import functools
+import hashlib
+import html
+import itertools
+import json
 import os
+import re
 import requests
+import threading
+import urllib3
 from datetime import datetime, timedelta, timezone
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 import importlib
+from operator import attrgetter
+
+import pandas as pd
+
+import aiohttp
+
+# Optional orjson (stdlib json보다 3~5배 빠른 디코딩; 미설치 시 response.json() 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional pyahocorasick (다중 키워드 매칭을 O(텍스트 길이)로; 미설치 시 순차 스캔 대체)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Optional Polygon SDK (dynamic import to avoid hard dependency)
 PolygonRESTClient = None
@@ -15,14 +41,284 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# 공백 정규화용 정규식 (호출마다 split/join 리스트 할당 제거)
+_WS_RE = re.compile(r'\s+')
+
+# HTML 태그 제거용 정규식 (기사 content에 태그가 섞여 오는 경우;
+# 파서 객체를 만드는 것보다 컴파일된 치환 한 번이 훨씬 저렴)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# SDK 모델 필드 일괄 추출 (C 구현 attrgetter가 반복 getattr보다 ~2배 빠름)
+_POLY_FIELDS = attrgetter('title', 'description', 'article_url', 'image_url', 'published_utc', 'publisher')
+
+# 로컬 타임존은 임포트 시 1회만 계산 (호출마다 time.timezone/daylight 확인 제거)
+try:
+    _LOCAL_TZ = timezone(timedelta(seconds=-time.timezone if (time.daylight == 0) else -time.altzone))
+except Exception:
+    _LOCAL_TZ = timezone.utc
+
+
+@functools.lru_cache(maxsize=1024)
+def _epoch_to_rfc3339_z(epoch_seconds: int) -> str:
+    """epoch 초를 RFC3339 UTC 문자열('...Z')로 포맷 (동일 인자 반복 호출 캐시)."""
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class _TokenBucket:
+    """토큰 버킷 rate limiter.
+
+    고정 간격 sleep 대신 버킷 용량(capacity)까지 버스트를 허용하고,
+    버킷이 비었을 때만 리필에 필요한 시간만큼 대기합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # 초당 리필 토큰 수
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        # 수집 스레드 풀에서 동시 호출되므로 토큰 계산은 락으로 보호
+        # (대기 자체는 락 밖에서 수행)
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _wait_time(self) -> float:
+        """토큰 1개를 소비하고, 필요한 경우 대기 시간을 반환합니다."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return 0.0
+            wait = (1.0 - self.tokens) / self.rate
+            self.tokens -= 1.0
+            return wait
+
+    def acquire(self):
+        """동기 획득: 토큰이 없으면 블로킹 대기."""
+        wait = self._wait_time()
+        if wait > 0:
+            logger.info(f"⏳ API 호출 제한으로 {wait:.1f}초 대기")
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """비동기 획득: 토큰이 없으면 이벤트 루프를 막지 않고 대기."""
+        wait = self._wait_time()
+        if wait > 0:
+            logger.info(f"⏳ API 호출 제한으로 {wait:.1f}초 대기")
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """429 등 서버 측 제한 신호를 받으면 해당 시간만큼 버킷을 비웁니다."""
+        with self._lock:
+            self._refill()
+            self.tokens = -seconds * self.rate
+
+
+@functools.lru_cache(maxsize=64)
+def _company_match_keywords(company_name: str, ticker: str) -> tuple:
+    """회사 관련성 매칭용 소문자 키워드 목록 (회사별로 1회만 생성)."""
+    keywords = [
+        ticker.lower(),
+        company_name.lower(),
+        company_name.replace(' Inc.', '').replace(' Corporation', '').replace(' Corp.', '').replace(' Ltd.', '').lower(),
+        company_name.split()[0].lower() if ' ' in company_name else company_name.lower(),
+    ]
+
+    # 특별한 경우 처리
+    if ticker in SPECIAL_KEYWORDS:
+        keywords.extend(k.lower() for k in SPECIAL_KEYWORDS[ticker])
+
+    # 순서 유지 중복 제거
+    return tuple(dict.fromkeys(keywords))
+
+
+@functools.lru_cache(maxsize=64)
+def _company_pattern(company_name: str, ticker: str):
+    """회사 키워드를 하나로 합친 IGNORECASE 정규식 (회사별 1회만 컴파일).
+
+    키워드별 `in` 검사 대신 C 수준의 단일 스캔으로 매칭하며,
+    대소문자 무시 플래그 덕분에 텍스트 `.lower()` 사본도 불필요합니다.
+    """
+    union = '|'.join(map(re.escape, _company_match_keywords(company_name, ticker)))
+    return re.compile(union, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _company_automaton(company_name: str, ticker: str):
+    """회사별 Aho-Corasick 자동자 (pyahocorasick 미설치 시 None)."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in _company_match_keywords(company_name, ticker):
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+class _AdaptiveSemaphore:
+    """AIMD(가산 증가/승산 감소) 방식의 적응형 동시성 제한.
+
+    성공 응답이 window회 누적될 때마다 허용 동시성을 가산 증가시키고,
+    429/5xx 응답을 받으면 절반으로 줄여 서버 측 제한에 수렴합니다.
+    asyncio.Semaphore와 달리 실행 중 한도를 조정할 수 있습니다.
+    """
+
+    def __init__(self, initial: float = 8, min_concurrency: float = 1,
+                 max_concurrency: float = 16, increase: float = 0.5,
+                 decrease: float = 0.5, window: int = 20):
+        self._concurrency = float(initial)
+        self._min = min_concurrency
+        self._max = max_concurrency
+        self._increase = increase
+        self._decrease = decrease
+        self._window = window
+        self._successes = 0
+        self._inflight = 0
+        # Condition은 대기한 이벤트 루프에 묶이므로 루프마다 지연 생성
+        # (asyncio.run을 호출마다 새로 여는 collect_many에서 재사용 가능,
+        # AIMD로 학습한 동시성 한도는 루프가 바뀌어도 유지)
+        self._cond = None
+        self._loop = None
+
+    @property
+    def concurrency(self) -> float:
+        return self._concurrency
+
+    def _bind(self) -> asyncio.Condition:
+        """현재 실행 중인 루프에 묶인 Condition을 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+            self._inflight = 0  # 이전 루프의 태스크는 모두 종료된 상태
+        return self._cond
+
+    async def __aenter__(self):
+        cond = self._bind()
+        async with cond:
+            while self._inflight >= int(self._concurrency):
+                await cond.wait()
+            self._inflight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        cond = self._bind()
+        async with cond:
+            self._inflight -= 1
+            cond.notify_all()
+        return False
+
+    def record_success(self):
+        """2xx 응답: window회마다 동시성 가산 증가."""
+        self._successes += 1
+        if self._successes >= self._window:
+            self._successes = 0
+            self._concurrency = min(self._max, self._concurrency + self._increase)
+
+    def record_throttle(self):
+        """429/5xx 응답: 동시성 승산 감소."""
+        self._successes = 0
+        old = self._concurrency
+        self._concurrency = max(self._min, self._concurrency * self._decrease)
+        if self._concurrency < old:
+            logger.info(f"🐢 동시성 감소: {old:.1f} → {self._concurrency:.1f}")
+
+
+# 회사별 추가 검색/매칭 키워드 (GNews 백엔드용)
+SPECIAL_KEYWORDS = {
+    'AAPL': ['Apple Inc', 'iPhone', 'iPad', 'Mac'],
+    'MSFT': ['Microsoft', 'Windows', 'Office', 'Azure'],
+    'GOOGL': ['Google', 'Alphabet', 'YouTube', 'Android'],
+    'GOOG': ['Google', 'Alphabet', 'YouTube', 'Android'],
+    'META': ['Meta', 'Facebook', 'Instagram', 'WhatsApp'],
+    'TSLA': ['Tesla', 'Elon Musk', 'electric vehicle'],
+    'AMZN': ['Amazon', 'AWS', 'Jeff Bezos'],
+    'NVDA': ['NVIDIA', 'GPU', 'graphics card', 'AI chip'],
+    'NFLX': ['Netflix', 'streaming'],
+    'AVGO': ['Broadcom'],
+}
+
+
+class _PolygonBackend:
+    """Polygon Stocks News API 백엔드 (티커 기반 검색)."""
+
+    name = 'polygon'
+
+    def __init__(self, collector: 'NewsCollector'):
+        self._collector = collector
+
+    def keywords(self, company_name: str, ticker: str) -> List[str]:
+        # Polygon은 티커 기반 검색 사용
+        return [ticker]
+
+    def search(self, query: str, from_date: datetime, to_date: datetime) -> List[Dict]:
+        return self._collector.search_polygon(query, from_date, to_date, max_articles=100)
+
+    async def search_async(self, session, query: str, from_date: datetime, to_date: datetime) -> List[Dict]:
+        return await self._collector.search_polygon_async(session, query, from_date, to_date, max_articles=100)
+
+    def postprocess(self, news_items: List[Dict], company_name: str, ticker: str) -> List[Dict]:
+        # 티커 기반 검색이므로 추가 관련성 필터 불필요
+        return news_items
+
+
+class _GNewsBackend:
+    """GNews API 백엔드 (키워드 기반 검색)."""
+
+    name = 'gnews'
+
+    def __init__(self, collector: 'NewsCollector'):
+        self._collector = collector
+
+    def keywords(self, company_name: str, ticker: str) -> List[str]:
+        # 상위 3개 키워드를 불리언 OR로 묶어 API 호출 1회로 검색
+        top_keywords = self._collector.get_company_keywords(company_name, ticker)[:3]
+        return [' OR '.join(f'({k})' for k in top_keywords)]
+
+    def search(self, query: str, from_date: datetime, to_date: datetime) -> List[Dict]:
+        return self._collector.search_gnews(query, from_date, to_date, max_articles=60)
+
+    async def search_async(self, session, query: str, from_date: datetime, to_date: datetime) -> List[Dict]:
+        return await self._collector.search_gnews_async(session, query, from_date, to_date, max_articles=60)
+
+    def postprocess(self, news_items: List[Dict], company_name: str, ticker: str) -> List[Dict]:
+        # 키워드 검색은 무관한 기사가 섞일 수 있으므로 회사 관련성 필터 적용
+        return self._collector.filter_news_by_company(news_items, company_name, ticker)
+
+
 class NewsCollector:
-    def __init__(self, polygon_api_key: Optional[str] = None):
+    """뉴스 수집기.
+
+    backend='polygon'(기본) 또는 'gnews'로 생성하며, 공통 로직(세션,
+    rate limit, 날짜 필터, 중복 제거, 텍스트 결합)은 공유하고 백엔드별
+    검색/키워드/후처리는 전략 객체가 담당합니다.
+    """
+
+    def __init__(
+        self,
+        polygon_api_key: Optional[str] = None,
+        backend: str = 'polygon',
+        gnews_api_key: Optional[str] = None,
+    ):
+        if backend not in ('polygon', 'gnews'):
+            raise ValueError(f"지원하지 않는 backend: {backend}")
+        self.backend = backend
+
         # Polygon Stocks News API
         self.polygon_api_key = polygon_api_key or os.getenv("POLYGON_API_KEY")
         self.polygon_base_url = "https://api.polygon.io/v2/reference/news"
+
+        # GNews API
+        self.gnews_api_key = gnews_api_key or os.getenv("GNEWS_API_KEY", "44cc3fd97fb6417d55aeb8d962f7a831")
+        self.gnews_base_url = "https://gnews.io/api/v4/search"
+
         # Initialize SDK client if available
         self._polygon_client = None
-        if self.polygon_api_key:
+        if backend == 'polygon' and self.polygon_api_key:
             try:
                 polygon_mod = importlib.import_module('polygon')
                 rest_client_cls = getattr(polygon_mod, 'RESTClient', None)
@@ -46,35 +342,170 @@ class NewsCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        # API 호출 제한 관리
-        self.last_api_call = 0
-        self.min_call_interval = 1.0  # 1초 간격
+        # 호출마다 TCP+TLS 핸드셰이크를 반복하지 않도록 세션을 재사용 (keep-alive + 커넥션 풀)
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=urllib3.util.Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._session.mount('https://', adapter)
+
+        # API 호출 제한 관리 (Polygon 유료 티어 ~100회/분 버스트 10회, GNews 1회/초 버스트 3회)
+        if backend == 'gnews':
+            self._rate_limiter = _TokenBucket(rate=1.0, capacity=3)
+        else:
+            self._rate_limiter = _TokenBucket(rate=100 / 60.0, capacity=10)
+
+        # 일자별 전체 뉴스 캐시: {date_str: {ticker: [news, ...]}}
+        self._day_news_cache: Dict[str, Dict[str, List[Dict]]] = {}
+
+        # 비동기 수집용 적응형 동시성 제한 (429/5xx에 반응해 AIMD로 조절)
+        self._adaptive_sem = _AdaptiveSemaphore(initial=8, max_concurrency=16)
+
+        # 백엔드별 검색/키워드/후처리 전략
+        self._backend = _GNewsBackend(self) if backend == 'gnews' else _PolygonBackend(self)
 
     @staticmethod
     def _to_rfc3339_z(dt: datetime) -> str:
         """Format datetime to RFC3339 (ISO8601) in UTC ending with 'Z'."""
         if dt.tzinfo is None:
             # Naive datetime as local time; convert to UTC
+            dt = dt.replace(tzinfo=_LOCAL_TZ)
+        return _epoch_to_rfc3339_z(int(dt.timestamp()))
+
+    # 디스크 캐시 설정: 과거 날짜는 뉴스가 바뀌지 않으므로 무기한, 당일은 1시간
+    _CACHE_DIR = os.path.join('.cache', 'polygon')
+    _TODAY_CACHE_TTL = 3600
+
+    # GNews 캐시: 동일 (query, from, to) 재질의가 많으므로 몇 시간 TTL
+    _GNEWS_CACHE_DIR = os.path.join('.cache', 'gnews')
+    _GNEWS_CACHE_TTL = 6 * 3600
+
+    def _gnews_cache_path(self, query: str, from_str: str, to_str: str, max_articles: int) -> str:
+        """정규화한 질의 파라미터의 MD5 키로 GNews 캐시 파일 경로를 만듭니다."""
+        key = hashlib.md5(f"{query.lower().strip()}|{from_str}|{to_str}|{max_articles}".encode()).hexdigest()
+        return os.path.join(self._GNEWS_CACHE_DIR, f"{key}.json")
+
+    def _news_cache_path(self, ticker: str, gte: Optional[str], lte: Optional[str], max_articles: int) -> str:
+        """검색 파라미터를 정규화한 MD5 키로 캐시 파일 경로를 만듭니다."""
+        key = hashlib.md5(f"{ticker}|{gte}|{lte}|{max_articles}".encode()).hexdigest()
+        return os.path.join(self._CACHE_DIR, ticker, f"{key}.json")
+
+    @staticmethod
+    def _load_news_cache(path: str, ttl: Optional[float]) -> Optional[List[Dict]]:
+        """캐시 파일을 로드합니다. 없거나 만료/손상된 경우 None 반환."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if ttl is not None and time.time() - payload.get('ts', 0) >= ttl:
+                return None
+            news_items = payload['data']
+            # published_date는 ISO 문자열로 저장되므로 다시 datetime으로 변환
+            for news in news_items:
+                if news.get('published_date'):
+                    news['published_date'] = datetime.fromisoformat(news['published_date'])
+            return news_items
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _store_news_cache(path: str, news_items: List[Dict]):
+        """뉴스 리스트를 캐시 파일에 저장합니다 (tmp 작성 후 rename)."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            serializable = []
+            for news in news_items:
+                item = dict(news)
+                if isinstance(item.get('published_date'), datetime):
+                    item['published_date'] = item['published_date'].isoformat()
+                serializable.append(item)
+
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'data': serializable}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # 캐시 저장 실패는 치명적이지 않음
+
+    @staticmethod
+    def _parse_polygon_article(article: Dict) -> Dict:
+        """Polygon HTTP 응답의 기사(dict)를 내부 뉴스 포맷으로 변환."""
+        published_date = None
+        pub_str = article.get('published_utc')
+        if pub_str:
             try:
-                offset_sec = -time.timezone if (time.daylight == 0) else -time.altzone
-                local_tz = timezone(timedelta(seconds=offset_sec))
-                dt = dt.replace(tzinfo=local_tz)
+                published_date = datetime.fromisoformat(str(pub_str).replace('Z', '+00:00'))
             except Exception:
-                dt = dt.replace(tzinfo=timezone.utc)
-        dt_utc = dt.astimezone(timezone.utc)
-        return dt_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
+                published_date = None
+
+        publisher = article.get('publisher') or {}
+        return {
+            'title': article.get('title', ''),
+            'description': article.get('description', ''),
+            'content': None,
+            'link': article.get('article_url', ''),
+            'published_date': published_date,
+            'source': publisher.get('name', 'Unknown'),
+            'image': article.get('image_url', ''),
+        }
+
+    @staticmethod
+    def _parse_gnews_article(article: Dict) -> Dict:
+        """GNews 응답의 기사(dict)를 내부 뉴스 포맷으로 변환."""
+        published_date = None
+        if 'publishedAt' in article:
+            try:
+                published_date = datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00'))
+            except Exception:
+                published_date = None
+
+        return {
+            'title': article.get('title', ''),
+            'description': article.get('description', ''),
+            'content': article.get('content', ''),
+            'link': article.get('url', ''),
+            'published_date': published_date,
+            'source': article.get('source', {}).get('name', 'Unknown'),
+            'image': article.get('image', '')
+        }
 
-    def _wait_for_rate_limit(self):
-        """API 호출 간격 제한"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_api_call
+    @classmethod
+    def _parse_gnews_articles(cls, articles: List[Dict]) -> List[Dict]:
+        """GNews 기사 목록을 일괄 변환.
 
-        if time_since_last_call < self.min_call_interval:
-            wait_time = self.min_call_interval - time_since_last_call
-            logger.info(f"⏳ API 호출 제한으로 {wait_time:.1f}초 대기")
-            time.sleep(wait_time)
+        기사별 dict 순회 대신 컬럼 단위(SoA) DataFrame으로 모아
+        날짜 파싱과 (title, link) 중복 제거를 벡터 연산으로 수행하고,
+        경계에서는 기존 계약대로 record(dict) 리스트로 되돌립니다.
+        발행일 파싱 실패는 None이 됩니다.
+        """
+        if not articles:
+            return []
 
-        self.last_api_call = time.time()
+        df = pd.DataFrame({
+            'title': [a.get('title', '') for a in articles],
+            'description': [a.get('description', '') for a in articles],
+            'content': [a.get('content', '') for a in articles],
+            'link': [a.get('url', '') for a in articles],
+            'published_date': pd.to_datetime([a.get('publishedAt') for a in articles], utc=True, errors='coerce'),
+            'source': [a.get('source', {}).get('name', 'Unknown') for a in articles],
+            'image': [a.get('image', '') for a in articles],
+        })
+
+        # OR 결합 질의(한 번에 여러 키워드) 응답에는 동일 기사가 중복
+        # 포함될 수 있으므로 수집 단계에서 벡터 연산으로 제거
+        df = df.drop_duplicates(subset=('title', 'link'))
+
+        news_items = df.to_dict('records')
+        for item in news_items:
+            pub_date = item['published_date']
+            item['published_date'] = None if pd.isna(pub_date) else pub_date.to_pydatetime()
+        return news_items
 
     def search_polygon(self, ticker: str, from_date: datetime, to_date: datetime, max_articles: int = 50) -> List[Dict]:
         """Polygon Stocks News API를 사용하여 뉴스 검색.
@@ -82,8 +513,6 @@ class NewsCollector:
         우선 Polygon SDK가 설치되어 있으면 SDK를 사용하고,
         없으면 HTTP 요청으로 대체합니다.
         """
-        self._wait_for_rate_limit()
-
         # Normalize and guard date range
         if from_date and to_date and from_date > to_date:
             from_date, to_date = to_date, from_date
@@ -96,6 +525,16 @@ class NewsCollector:
             logger.error("POLYGON_API_KEY가 설정되지 않았습니다. 환경변수 또는 생성자 인자로 제공하세요.")
             return []
 
+        # 디스크 캐시 조회 (백테스트 재실행 시 네트워크 왕복 제거)
+        cache_path = self._news_cache_path(ticker, gte, lte, max_articles)
+        is_today = to_date is None or to_date.date() >= datetime.now().date()
+        cached = self._load_news_cache(cache_path, self._TODAY_CACHE_TTL if is_today else None)
+        if cached is not None:
+            logger.info(f"💾 Polygon 캐시 적중: '{ticker}' ({len(cached)}개 뉴스)")
+            return cached
+
+        self._rate_limiter.acquire()
+
         # Prefer SDK if available
         if self._polygon_client is not None:
             try:
@@ -113,57 +552,46 @@ class NewsCollector:
                     sort="published_utc",
                     limit=min(max_articles, 1000),
                 )
-                count = 0
-                for n in gen:
-                    count += 1
-                    # 모델 또는 dict 형태 모두 지원
-                    if PolygonTickerNews is not None and isinstance(n, PolygonTickerNews):
-                        published_date = None
-                        try:
-                            # SDK 모델의 published_utc는 datetime일 수 있음
-                            published_date = (
-                                n.published_utc if isinstance(n.published_utc, datetime)
-                                else datetime.fromisoformat(str(n.published_utc).replace('Z', '+00:00'))
-                            )
-                        except Exception:
-                            published_date = None
+                # islice로 정확히 max_articles에서 소비를 멈춰 SDK가 다음 페이지를 받지 않도록 함
+                gen_iter = itertools.islice(gen, max_articles)
+                first = next(gen_iter, None)
 
-                        news_item = {
-                            'title': getattr(n, 'title', '') or '',
-                            'description': getattr(n, 'description', '') or '',
-                            'content': None,
-                            'link': getattr(n, 'article_url', '') or '',
-                            'published_date': published_date,
-                            'source': (getattr(getattr(n, 'publisher', None), 'name', None) or 'Unknown'),
-                            'image': getattr(n, 'image_url', '') or '',
-                        }
-                    else:
-                        # dict-like
-                        pub_str = (n.get('published_utc') if isinstance(n, dict) else None)
-                        published_date = None
-                        if pub_str:
+                if first is not None:
+                    # 제너레이터는 단일 타입만 내보내므로 첫 항목으로 한 번만 분기
+                    is_model = PolygonTickerNews is not None and isinstance(first, PolygonTickerNews)
+
+                    for n in itertools.chain((first,), gen_iter):
+                        if is_model:
+                            t, d, u, img, pub, publ = _POLY_FIELDS(n)
+
+                            published_date = None
                             try:
-                                published_date = datetime.fromisoformat(str(pub_str).replace('Z', '+00:00'))
+                                # SDK 모델의 published_utc는 datetime일 수 있음
+                                published_date = (
+                                    pub if isinstance(pub, datetime)
+                                    else datetime.fromisoformat(str(pub).replace('Z', '+00:00'))
+                                )
                             except Exception:
                                 published_date = None
 
-                        publisher = (n.get('publisher') if isinstance(n, dict) else {}) or {}
-                        news_item = {
-                            'title': (n.get('title') if isinstance(n, dict) else '') or '',
-                            'description': (n.get('description') if isinstance(n, dict) else '') or '',
-                            'content': None,
-                            'link': (n.get('article_url') if isinstance(n, dict) else '') or '',
-                            'published_date': published_date,
-                            'source': publisher.get('name', 'Unknown'),
-                            'image': (n.get('image_url') if isinstance(n, dict) else '') or '',
-                        }
-
-                    if len(items) < max_articles:
+                            news_item = {
+                                'title': t or '',
+                                'description': d or '',
+                                'content': None,
+                                'link': u or '',
+                                'published_date': published_date,
+                                'source': getattr(publ, 'name', None) or 'Unknown',
+                                'image': img or '',
+                            }
+                        elif isinstance(n, dict):
+                            news_item = self._parse_polygon_article(n)
+                        else:
+                            continue
+
                         items.append(news_item)
-                    else:
-                        break
 
-                logger.info(f"📰 Polygon SDK: {len(items)}개 뉴스 발견 (원시 {count}개)")
+                logger.info(f"📰 Polygon SDK: {len(items)}개 뉴스 발견")
+                self._store_news_cache(cache_path, items)
                 return items
             except Exception as e:
                 logger.warning(f"Polygon SDK 호출 오류, HTTP로 대체: {e}")
@@ -184,49 +612,41 @@ class NewsCollector:
 
         try:
             logger.info(f"🔍 Polygon HTTP 검색: '{ticker}' (기간: {gte or '-'} ~ {lte or '-'})")
-            response = requests.get(self.polygon_base_url, params=params, headers=self.headers, timeout=30)
+            response = self._session.get(self.polygon_base_url, params=params, timeout=30)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content) if orjson is not None else response.json()
                 results = data.get('results', [])
                 logger.info(f"📰 Polygon HTTP: {len(results)}개 뉴스 발견")
 
                 news_items: List[Dict] = []
                 for i, article in enumerate(results):
                     try:
-                        published_date = None
-                        pub_str = article.get('published_utc')
-                        if pub_str:
-                            published_date = datetime.fromisoformat(str(pub_str).replace('Z', '+00:00'))
-
-                        publisher = article.get('publisher') or {}
-                        news_item = {
-                            'title': article.get('title', ''),
-                            'description': article.get('description', ''),
-                            'content': None,
-                            'link': article.get('article_url', ''),
-                            'published_date': published_date,
-                            'source': publisher.get('name', 'Unknown'),
-                            'image': article.get('image_url', ''),
-                        }
+                        news_item = self._parse_polygon_article(article)
                         news_items.append(news_item)
 
-                        if i < 3:
-                            logger.info(f"  📄 뉴스 {i+1}: {news_item['title'][:50]}...")
-                            logger.info(f"      발행일: {published_date}")
-                            logger.info(f"      출처: {news_item['source']}")
+                        if i < 3 and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"  📄 뉴스 {i+1}: {news_item['title'][:50]}...")
+                            logger.debug(f"      발행일: {news_item['published_date']}")
+                            logger.debug(f"      출처: {news_item['source']}")
                     except Exception as e:
                         logger.warning(f"뉴스 항목 파싱 오류: {e}")
                         logger.warning(f"원본 데이터: {article}")
                         continue
 
                 logger.info(f"✅ 총 {len(news_items)}개 뉴스 항목 파싱 완료")
+                self._store_news_cache(cache_path, news_items)
                 return news_items
             elif response.status_code == 403:
                 logger.error("❌ Polygon API 인증 실패 - API 키를 확인하세요")
                 return []
             elif response.status_code == 429:
-                logger.warning("⚠️ Polygon API 호출 제한 초과 - 잠시 대기")
-                time.sleep(60)
+                # Retry-After 헤더를 존중하여 그 시간만큼 버킷을 비움 (기본 60초)
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 60))
+                except ValueError:
+                    retry_after = 60.0
+                logger.warning(f"⚠️ Polygon API 호출 제한 초과 - {retry_after:.0f}초 감속")
+                self._rate_limiter.penalize(retry_after)
                 return []
             else:
                 logger.error(f"❌ Polygon API 오류: {response.status_code} - {response.text}")
@@ -235,8 +655,191 @@ class NewsCollector:
             logger.error(f"Polygon HTTP 호출 오류: {e}")
             return []
 
+    def search_gnews(self, query: str, from_date: datetime, to_date: datetime,
+                     max_articles: int = 10, force_refresh: bool = False) -> List[Dict]:
+        """GNews API를 사용하여 뉴스 검색 (결과는 디스크에 캐시)"""
+        # 날짜 형식 변환 (YYYY-MM-DD)
+        from_str = from_date.strftime('%Y-%m-%d')
+        to_str = to_date.strftime('%Y-%m-%d')
+
+        # 디스크 캐시 조회 (동일 질의 반복 시 네트워크 왕복 제거)
+        cache_path = self._gnews_cache_path(query, from_str, to_str, max_articles)
+        if not force_refresh:
+            cached = self._load_news_cache(cache_path, self._GNEWS_CACHE_TTL)
+            if cached is not None:
+                logger.info(f"💾 GNews 캐시 적중: '{query}' ({len(cached)}개 뉴스)")
+                return cached
+
+        self._rate_limiter.acquire()
+
+        # API 파라미터 설정
+        params = {
+            'q': query,
+            'token': self.gnews_api_key,
+            'lang': 'en',
+            'country': 'us',
+            'max': min(max_articles, 100),  # API 최대 100개 제한
+            'from': from_str,
+            'to': to_str,
+            'sortby': 'relevance'
+        }
+
+        try:
+            logger.info(f"🔍 GNews API 검색: '{query}' ({from_str} ~ {to_str})")
+
+            response = self._session.get(self.gnews_base_url, params=params, timeout=30)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+                articles = data.get('articles', [])
+
+                logger.info(f"📰 GNews API: {len(articles)}개 뉴스 발견")
+
+                # 뉴스 데이터 변환 (성공 응답만 캐시)
+                news_items = self._parse_gnews_articles(articles)
+                self._store_news_cache(cache_path, news_items)
+                return news_items
+
+            elif response.status_code == 403:
+                logger.error("❌ GNews API 인증 실패 - API 키를 확인하세요")
+                return []
+            elif response.status_code == 429:
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 60))
+                except ValueError:
+                    retry_after = 60.0
+                logger.warning(f"⚠️ GNews API 호출 제한 초과 - {retry_after:.0f}초 감속")
+                self._rate_limiter.penalize(retry_after)
+                return []
+            else:
+                logger.error(f"❌ GNews API 오류: {response.status_code}")
+                return []
+
+        except Exception as e:
+            logger.error(f"GNews API 호출 오류: {e}")
+            return []
+
+    def get_company_keywords(self, company_name: str, ticker: str) -> List[str]:
+        """회사별 검색 키워드 생성"""
+        keywords = [ticker]
+
+        # 기본 회사명
+        keywords.append(f'"{company_name}"')
+
+        # 특별한 경우 처리
+        if ticker in SPECIAL_KEYWORDS:
+            keywords.extend(SPECIAL_KEYWORDS[ticker])
+
+        return keywords
+
+    def filter_news_by_company(self, news_items: List[Dict], company_name: str, ticker: str) -> List[Dict]:
+        """회사명이나 티커가 포함된 뉴스만 필터링
+
+        pyahocorasick이 설치되어 있으면 모든 키워드를 한 번의 텍스트 스캔으로
+        검사하는 자동자를 사용하고, 없으면 미리 컴파일된 키워드 결합
+        정규식으로 대체합니다 (키워드별 `in` 순차 검사 제거).
+        """
+        automaton = _company_automaton(company_name, ticker)
+
+        if automaton is not None:
+            return [
+                news for news in news_items
+                if next(automaton.iter(f"{news['title']} {news['description']}".lower()), None) is not None
+            ]
+
+        pattern = _company_pattern(company_name, ticker)
+        return [
+            news for news in news_items
+            if pattern.search(news['title']) or pattern.search(news['description'])
+        ]
+
+    def fetch_day_news(self, target_date: datetime, max_pages: int = 10) -> Dict[str, List[Dict]]:
+        """특정 날짜의 전체 뉴스를 한 번에 수집하여 티커별로 분류합니다.
+
+        티커당 1회씩 100번 호출하는 대신, 티커 필터 없이 당일 뉴스를
+        limit=1000으로 페이징 수집한 뒤 article['tickers'] 기준으로
+        로컬에서 버킷팅합니다. 결과는 날짜별 인메모리 캐시에 저장되어
+        이후 `collect_company_news` 호출은 네트워크 없이 조회됩니다.
+        """
+        date_key = target_date.strftime('%Y-%m-%d')
+        cached = self._day_news_cache.get(date_key)
+        if cached is not None:
+            return cached
+
+        if not self.polygon_api_key:
+            logger.error("POLYGON_API_KEY가 설정되지 않았습니다. 환경변수 또는 생성자 인자로 제공하세요.")
+            return {}
+
+        start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        params = {
+            'order': 'desc',
+            'sort': 'published_utc',
+            'limit': 1000,
+            'published_utc.gte': self._to_rfc3339_z(start_date),
+            'published_utc.lte': self._to_rfc3339_z(end_date),
+            'apiKey': self.polygon_api_key,
+        }
+
+        buckets: Dict[str, List[Dict]] = {}
+        url = self.polygon_base_url
+        total = 0
+        complete = False  # 모든 페이지를 성공적으로 받았을 때만 캐시
+
+        logger.info(f"🔍 Polygon 일괄 검색: {date_key} 전체 뉴스")
+
+        for page in range(max_pages):
+            self._rate_limiter.acquire()
+            try:
+                response = self._session.get(url, params=params, timeout=30)
+            except Exception as e:
+                logger.error(f"Polygon 일괄 호출 오류: {e}")
+                break
+
+            if response.status_code == 429:
+                # Retry-After 헤더를 존중하여 그 시간만큼 버킷을 비움 (기본 60초)
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 60))
+                except (TypeError, ValueError):
+                    retry_after = 60.0
+                logger.warning(f"⚠️ Polygon API 호출 제한 초과 - {retry_after:.0f}초 감속")
+                self._rate_limiter.penalize(retry_after)
+                break
+
+            if response.status_code != 200:
+                logger.error(f"❌ Polygon API 오류: {response.status_code}")
+                break
+
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            results = data.get('results', [])
+            total += len(results)
+
+            for article in results:
+                news_item = self._parse_polygon_article(article)
+                for t in article.get('tickers') or []:
+                    buckets.setdefault(t, []).append(news_item)
+
+            next_url = data.get('next_url')
+            if not next_url:
+                complete = True
+                break
+            # next_url에는 커서가 포함되므로 apiKey만 다시 전달
+            url = next_url
+            params = {'apiKey': self.polygon_api_key}
+
+        if not complete:
+            # 실패/부분 수집을 캐시하면 하루 전체가 "뉴스 없음"으로 굳어
+            # 티커별 폴백 경로까지 막히므로, 캐시하지 않고 빈 결과만 반환
+            logger.warning(f"⚠️ Polygon 일괄 수집 실패 ({date_key}), 티커별 개별 수집으로 폴백")
+            return {}
+
+        logger.info(f"📰 Polygon 일괄: {total}개 뉴스 → {len(buckets)}개 티커 분류 완료")
+        self._day_news_cache[date_key] = buckets
+        return buckets
+
     def collect_company_news(self, company_name: str, ticker: str, target_date: datetime) -> List[Dict]:
-        """특정 회사의 특정 날짜 뉴스 수집 (Polygon API 사용)"""
+        """특정 회사의 특정 날짜 뉴스 수집 (백엔드: Polygon 또는 GNews)"""
         all_news: List[Dict] = []
 
         # 날짜 범위 설정 (당일 전체)
@@ -246,98 +849,342 @@ class NewsCollector:
         logger.info(f"📰 {ticker} 뉴스 수집 시작...")
         logger.info(f"📅 검색 기간: {start_date.strftime('%Y-%m-%d')} (당일만)")
 
-        # Polygon은 티커 기반 검색 사용
-        keywords = [ticker]
+        # 일괄 수집(fetch_day_news)된 당일 뉴스가 있으면 네트워크 호출 없이 조회
+        day_news = self._day_news_cache.get(target_date.strftime('%Y-%m-%d'))
+        if day_news is not None:
+            all_news.extend(self.filter_news_by_date(list(day_news.get(ticker, [])), target_date))
+        else:
+            keywords = self._backend.keywords(company_name, ticker)
 
-        # 각 키워드(티커)로 검색
-        for i, keyword in enumerate(keywords, 1):
-            try:
-                logger.info(f"🔍 키워드 {i}: '{keyword}' 검색 중...")
-
-                # Polygon API로 뉴스 검색 (정확한 일자 범위 전달)
-                news_items = self.search_polygon(
-                    ticker=keyword,
-                    from_date=start_date,
-                    to_date=end_date,
-                    max_articles=100,
-                )
+            # 각 키워드로 검색
+            for i, keyword in enumerate(keywords, 1):
+                try:
+                    logger.info(f"🔍 키워드 {i}: '{keyword}' 검색 중...")
 
-                if news_items:
-                    # 대상 날짜 필터링
-                    filtered_news = self.filter_news_by_date(news_items, target_date)
-                    all_news.extend(filtered_news)
+                    # 백엔드 API로 뉴스 검색 (정확한 일자 범위 전달)
+                    news_items = self._backend.search(keyword, start_date, end_date)
 
-                    logger.info(f"  ✅ '{keyword}': {len(filtered_news)}개 관련 뉴스")
-                else:
-                    logger.info(f"  ❌ '{keyword}': 뉴스 없음")
+                    if news_items:
+                        # 대상 날짜 필터링
+                        filtered_news = self.filter_news_by_date(news_items, target_date)
+                        all_news.extend(filtered_news)
 
-                # API 호출 제한 대기
-                time.sleep(1)
+                        logger.info(f"  ✅ '{keyword}': {len(filtered_news)}개 관련 뉴스")
+                    else:
+                        logger.info(f"  ❌ '{keyword}': 뉴스 없음")
 
-            except Exception as e:
-                logger.warning(f"키워드 '{keyword}' 검색 실패: {e}")
-                continue
+                    # 호출 간격은 search_* 진입부의 토큰 버킷이 관리하므로 추가 대기 없음
 
-        # 중복 제거 (제목과 URL 기준)
-        seen_items = set()
-        unique_news: List[Dict] = []
+                except Exception as e:
+                    logger.warning(f"키워드 '{keyword}' 검색 실패: {e}")
+                    continue
 
-        for news in all_news:
-            # 제목과 URL을 결합한 키 생성
-            key = f"{news['title'].strip().lower()}_{news['link']}"
+        # 백엔드별 후처리 (GNews: 회사 관련성 필터)
+        all_news = self._backend.postprocess(all_news, company_name, ticker)
 
-            if key not in seen_items and len(news['title'].strip()) > 10:
-                seen_items.add(key)
-                unique_news.append(news)
+        # 중복 제거 (제목과 URL 기준)
+        unique_news = self._dedup_news(all_news)
 
         logger.info(f"🎯 {ticker} ({target_date.strftime('%Y-%m-%d')}): 총 {len(unique_news)}개 유니크 뉴스 수집")
 
-        # 수집된 뉴스 요약 로깅
-        if unique_news:
-            logger.info(f"📊 뉴스 출처 분포:")
+        # 수집된 뉴스 요약 로깅 (출처별 분포는 DEBUG에서만)
+        if unique_news and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📊 뉴스 출처 분포:")
             sources: Dict[str, int] = {}
             for news in unique_news:
                 source = news['source']
                 sources[source] = sources.get(source, 0) + 1
 
             for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
-                logger.info(f"  - {source}: {count}개")
+                logger.debug(f"  - {source}: {count}개")
+
+        return unique_news
+
+    @staticmethod
+    def _dedup_news(all_news: List[Dict]) -> List[Dict]:
+        """제목과 URL 기준으로 중복 뉴스를 제거합니다.
+
+        키는 (소문자 제목, 링크) 튜플을 그대로 사용합니다. 튜플 해시는
+        구성 요소의 해시를 C 레벨에서 결합하므로 문자열 연결 후 해시나
+        별도 다이제스트 계산보다 빠르고 할당도 없습니다.
+        """
+        seen_items = set()
+        unique_news: List[Dict] = []
+
+        for news in all_news:
+            title_stripped = news['title'].strip()
+            if len(title_stripped) <= 10:
+                continue
+
+            key = (title_stripped.lower(), news['link'])
+
+            if key not in seen_items:
+                seen_items.add(key)
+                unique_news.append(news)
 
         return unique_news
 
+    async def search_polygon_async(
+        self,
+        session: aiohttp.ClientSession,
+        ticker: str,
+        from_date: datetime,
+        to_date: datetime,
+        max_articles: int = 100,
+    ) -> List[Dict]:
+        """Polygon Stocks News API 비동기 검색 (HTTP 전용).
+
+        동기 `search_polygon`과 같은 포맷의 뉴스 리스트를 반환합니다.
+        """
+        if not self.polygon_api_key:
+            logger.error("POLYGON_API_KEY가 설정되지 않았습니다. 환경변수 또는 생성자 인자로 제공하세요.")
+            return []
+
+        # Normalize and guard date range
+        if from_date and to_date and from_date > to_date:
+            from_date, to_date = to_date, from_date
+
+        gte = self._to_rfc3339_z(from_date) if from_date else None
+        lte = self._to_rfc3339_z(to_date) if to_date else None
+
+        params = {
+            'ticker': ticker,
+            'order': 'desc',
+            'sort': 'published_utc',
+            'limit': min(max_articles, 1000),
+            'apiKey': self.polygon_api_key,
+        }
+        if gte:
+            params['published_utc.gte'] = gte
+        if lte:
+            params['published_utc.lte'] = lte
+
+        await self._rate_limiter.acquire_async()
+
+        try:
+            logger.info(f"🔍 Polygon 비동기 검색: '{ticker}' (기간: {gte or '-'} ~ {lte or '-'})")
+            async with session.get(
+                self.polygon_base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    self._note_async_response_ok(response.headers)
+                    data = await response.json()
+                    results = data.get('results', [])
+                    news_items = [self._parse_polygon_article(a) for a in results]
+                    logger.info(f"📰 Polygon 비동기: {len(news_items)}개 뉴스 발견 ('{ticker}')")
+                    return news_items
+                elif response.status == 403:
+                    logger.error("❌ Polygon API 인증 실패 - API 키를 확인하세요")
+                    return []
+                elif response.status == 429:
+                    self._note_async_throttled(response.headers, "Polygon")
+                    return []
+                else:
+                    if response.status >= 500:
+                        self._adaptive_sem.record_throttle()
+                    logger.error(f"❌ Polygon API 오류: {response.status}")
+                    return []
+        except Exception as e:
+            logger.error(f"Polygon 비동기 호출 오류 ('{ticker}'): {e}")
+            return []
+
+    def _note_async_response_ok(self, headers):
+        """성공 응답 처리: AIMD 증가 + 잔여 쿼터가 10% 미만이면 선제 감속."""
+        self._adaptive_sem.record_success()
+        remaining = headers.get('X-Ratelimit-Remaining')
+        limit = headers.get('X-Ratelimit-Limit')
+        if remaining and limit:
+            try:
+                if float(remaining) < float(limit) * 0.1:
+                    logger.info("⚠️ API 잔여 쿼터 10% 미만 - 선제 감속")
+                    self._adaptive_sem.record_throttle()
+            except ValueError:
+                pass
+
+    def _note_async_throttled(self, headers, api_name: str):
+        """429 응답 처리: Retry-After만큼 버킷을 비우고 동시성을 절반으로."""
+        try:
+            retry_after = float(headers.get('Retry-After', 60))
+        except ValueError:
+            retry_after = 60.0
+        logger.warning(f"⚠️ {api_name} API 호출 제한 초과 - {retry_after:.0f}초 감속")
+        self._rate_limiter.penalize(retry_after)
+        self._adaptive_sem.record_throttle()
+
+    async def search_gnews_async(
+        self,
+        session: aiohttp.ClientSession,
+        query: str,
+        from_date: datetime,
+        to_date: datetime,
+        max_articles: int = 10,
+    ) -> List[Dict]:
+        """GNews API 비동기 검색.
+
+        동기 `search_gnews`와 같은 포맷의 뉴스 리스트를 반환합니다.
+        """
+        from_str = from_date.strftime('%Y-%m-%d')
+        to_str = to_date.strftime('%Y-%m-%d')
+
+        # 디스크 캐시 조회 (동기 경로와 공유)
+        cache_path = self._gnews_cache_path(query, from_str, to_str, max_articles)
+        cached = self._load_news_cache(cache_path, self._GNEWS_CACHE_TTL)
+        if cached is not None:
+            logger.info(f"💾 GNews 캐시 적중: '{query}' ({len(cached)}개 뉴스)")
+            return cached
+
+        params = {
+            'q': query,
+            'token': self.gnews_api_key,
+            'lang': 'en',
+            'country': 'us',
+            'max': min(max_articles, 100),
+            'from': from_str,
+            'to': to_str,
+            'sortby': 'relevance'
+        }
+
+        await self._rate_limiter.acquire_async()
+
+        try:
+            logger.info(f"🔍 GNews 비동기 검색: '{query}' ({from_str} ~ {to_str})")
+            async with session.get(
+                self.gnews_base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    self._note_async_response_ok(response.headers)
+                    data = await response.json()
+                    articles = data.get('articles', [])
+                    logger.info(f"📰 GNews 비동기: {len(articles)}개 뉴스 발견 ('{query}')")
+                    news_items = self._parse_gnews_articles(articles)
+                    self._store_news_cache(cache_path, news_items)
+                    return news_items
+                elif response.status == 403:
+                    logger.error("❌ GNews API 인증 실패 - API 키를 확인하세요")
+                    return []
+                elif response.status == 429:
+                    self._note_async_throttled(response.headers, "GNews")
+                    return []
+                else:
+                    if response.status >= 500:
+                        self._adaptive_sem.record_throttle()
+                    logger.error(f"❌ GNews API 오류: {response.status}")
+                    return []
+        except Exception as e:
+            logger.error(f"GNews 비동기 호출 오류 ('{query}'): {e}")
+            return []
+
+    async def collect_company_news_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        ticker: str,
+        target_date: datetime,
+        company_name: Optional[str] = None,
+    ) -> List[Dict]:
+        """특정 회사의 특정 날짜 뉴스를 비동기로 수집합니다.
+
+        백엔드 키워드별 검색을 asyncio.gather로 동시에 실행하므로
+        키워드 N개의 체감 지연은 합이 아닌 최댓값에 수렴합니다.
+        """
+        start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        keywords = self._backend.keywords(company_name or ticker, ticker)
+
+        async def search_one(keyword: str) -> List[Dict]:
+            async with semaphore:
+                return await self._backend.search_async(session, keyword, start_date, end_date)
+
+        results = await asyncio.gather(*(search_one(k) for k in keywords), return_exceptions=True)
+
+        all_news: List[Dict] = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, Exception):
+                logger.warning(f"키워드 '{keyword}' 검색 실패: {result}")
+                continue
+            all_news.extend(self.filter_news_by_date(result, target_date))
+
+        all_news = self._backend.postprocess(all_news, company_name or ticker, ticker)
+        return self._dedup_news(all_news)
+
+    def collect_all_companies_news(self, tickers: List[str], target_date: datetime) -> Dict[str, List[Dict]]:
+        """모든 티커의 당일 뉴스를 동시(비동기)로 수집합니다.
+
+        반환: {ticker: [news, ...]} 딕셔너리. 실패한 티커는 빈 리스트.
+        """
+        return self.collect_many([(ticker, ticker) for ticker in tickers], target_date)
+
+    def collect_many(self, companies: List[Tuple[str, str]], target_date: datetime) -> Dict[str, List[Dict]]:
+        """(회사명, 티커) 쌍 목록의 당일 뉴스를 동시(비동기)로 수집합니다.
+
+        티커만 받는 collect_all_companies_news와 달리 회사명을 함께 받아
+        GNews 백엔드의 키워드 생성과 관련성 필터에 사용합니다.
+        반환: {ticker: [news, ...]} 딕셔너리. 실패한 티커는 빈 리스트.
+        """
+        return asyncio.run(self._collect_many_async(companies, target_date))
+
+    async def _collect_many_async(
+        self, companies: List[Tuple[str, str]], target_date: datetime
+    ) -> Dict[str, List[Dict]]:
+        # 적응형 세마포어로 동시 요청 수를 제한 (429/5xx에 AIMD로 반응)
+        semaphore = self._adaptive_sem
+        connector = aiohttp.TCPConnector(limit_per_host=16)
+
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            tasks = [
+                self.collect_company_news_async(session, semaphore, ticker, target_date, company_name=company_name)
+                for company_name, ticker in companies
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        collected: Dict[str, List[Dict]] = {}
+        for (_, ticker), result in zip(companies, results):
+            if isinstance(result, Exception):
+                logger.warning(f"'{ticker}' 비동기 수집 실패: {result}")
+                collected[ticker] = []
+            else:
+                collected[ticker] = result
+
+        return collected
+
     def filter_news_by_date(self, news_items: List[Dict], target_date: datetime) -> List[Dict]:
-        """특정 날짜(당일) 뉴스만 필터링"""
+        """특정 날짜(당일) 뉴스만 필터링.
+
+        published_utc 범위는 이미 API 요청에 전달되므로, tz-aware 날짜는
+        서버 측 필터를 신뢰하고 그대로 통과시킵니다. tzinfo를 제거하고
+        비교하면 자정 부근 UTC 시각이 로컬 날짜 경계를 넘는 오류가
+        있었으므로 해당 변환도 제거합니다. 날짜가 없거나 naive한 항목만
+        방어적으로 비교합니다.
+        """
+        if not news_items:
+            return news_items
+
         # 정확히 당일만 포함
         start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        logger.info(f"📅 날짜 필터링 (당일만): {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
-        logger.info(f"📥 필터링 전 뉴스 수: {len(news_items)}")
+        pub_dates = [news['published_date'] for news in news_items]
 
-        filtered_news: List[Dict] = []
-        for i, news in enumerate(news_items):
-            # 날짜가 없는 경우 포함 (최신 뉴스로 간주)
-            if not news['published_date']:
-                logger.info(f"  ⚠️  뉴스 {i+1}: 날짜 없음 -> 포함")
-                filtered_news.append(news)
-                continue
+        # 날짜가 없는 경우 포함 (최신 뉴스로 간주), tz-aware는 API 필터 신뢰
+        passthrough = [d is None or d.tzinfo is not None for d in pub_dates]
 
-            # UTC 시간을 로컬 시간으로 변환 (필요시)
-            pub_date = news['published_date']
-            if pub_date.tzinfo:
-                pub_date = pub_date.replace(tzinfo=None)
+        # naive 날짜만 DatetimeIndex로 모아 범위 비교를 C 루프 한 번으로 수행
+        naive_dates = pd.DatetimeIndex([None if skip else d for skip, d in zip(passthrough, pub_dates)])
+        in_range = (naive_dates >= start_date) & (naive_dates <= end_date)
 
-            # 날짜 비교 로깅
-            is_in_range = start_date <= pub_date <= end_date
+        mask = [skip or bool(ok) for skip, ok in zip(passthrough, in_range)]
 
-            # 처음 5개만 상세 로깅
-            if i < 5:
-                logger.info(f"  📰 뉴스 {i+1}: {pub_date.strftime('%Y-%m-%d')} -> {'포함' if is_in_range else '제외'}")
+        # 처음 5개만 상세 로깅 (포맷팅 비용이 있으므로 DEBUG에서만)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, (pub_date, keep) in enumerate(itertools.islice(zip(pub_dates, mask), 5)):
+                date_str = pub_date.strftime('%Y-%m-%d') if pub_date else '날짜 없음'
+                logger.debug(f"  📰 뉴스 {i+1}: {date_str} -> {'포함' if keep else '제외'}")
 
-            if is_in_range:
-                filtered_news.append(news)
+        filtered_news = list(itertools.compress(news_items, mask))
 
-        logger.info(f"📤 필터링 후 뉴스 수: {len(filtered_news)}")
+        if len(filtered_news) != len(news_items):
+            logger.info(f"📤 날짜 필터링: {len(news_items)}개 중 {len(filtered_news)}개 유지")
 
         # 결과가 없어도 당일만 유지 (완화하지 않음)
         return filtered_news
@@ -347,34 +1194,48 @@ class NewsCollector:
         if not news_items:
             return ""
 
+        # 텍스트 길이 제한 (토큰 제한 고려): 한도에 도달하면 즉시 중단하여
+        # 전체를 결합한 뒤 자르는 낭비를 피함
+        max_len = 8000
         texts = []
+        size = 0
+        truncated = False
+
         for news in news_items:
-            # 제목, 설명, 내용을 모두 결합
+            # 제목과 본문(content가 있으면 description 대신 사용)을 결합
             text_parts = []
 
             if news.get('title'):
                 text_parts.append(news['title'])
 
-            if news.get('description'):
-                text_parts.append(news['description'])
-
             if news.get('content'):
-                # content가 있으면 description 대신 사용
                 text_parts.append(news['content'])
+            elif news.get('description'):
+                text_parts.append(news['description'])
 
-            # 텍스트 결합 및 정리
+            # 텍스트 결합, HTML 태그/엔티티 제거 및 공백 정리
             text = '. '.join(text_parts)
-            # 불필요한 공백 제거
-            text = ' '.join(text.split())
+            if '<' in text:
+                text = _TAG_RE.sub(' ', text)
+            text = _WS_RE.sub(' ', html.unescape(text)).strip()
+
+            if len(text) <= 50:  # 너무 짧은 텍스트 제외
+                continue
 
-            if len(text) > 50:  # 너무 짧은 텍스트 제외
-                texts.append(text)
+            sep = 3 if texts else 0  # ' | ' 구분자 길이
+            if size + sep + len(text) > max_len:
+                remaining = max_len - size - sep
+                if remaining > 0:
+                    texts.append(text[:remaining])
+                truncated = True
+                break
 
-        combined_text = ' | '.join(texts)
+            texts.append(text)
+            size += sep + len(text)
 
-        # 텍스트 길이 제한 (토큰 제한 고려)
-        if len(combined_text) > 8000:
-            combined_text = combined_text[:8000] + "..."
+        combined_text = ' | '.join(texts)
+        if truncated:
+            combined_text += "..."
 
         return combined_text
 
@@ -1,26 +1,181 @@
+import hashlib
+import os
+import re
 import requests
+import threading
+import urllib3
 import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+# Optional orjson (stdlib json보다 3~5배 빠른 인코딩/디코딩; 미설치 시 stdlib 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Ollama 요청을 직접 직렬화해 보낼 때의 헤더 (requests의 json= 경로 우회)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# 감성 점수 영속 캐시 (동일 뉴스 텍스트가 여러 티커/키워드에 걸쳐 재등장하므로
+# 재추론을 피함). 모델별 파일로 분리해 모델이 바뀌면 캐시가 섞이지 않음.
+_SENT_CACHE_DIR = os.path.join('.cache', 'sentiment')
+_SENT_CACHE_TTL = 7 * 86400  # 7일
+
+# 감성 점수 추출용 숫자 패턴 (-1.0 ~ 1.0 범위; 호출마다 재컴파일하지 않도록 모듈 스코프에 1회 컴파일)
+_SCORE_PATTERNS = (
+    re.compile(r'(-?[01]\.?\d*)'),  # -1.0, 0.5, 1.0 등
+    re.compile(r'(-?[01])'),        # -1, 0, 1 등
+    re.compile(r'(-?\d+\.?\d*)'),   # 일반적인 숫자
+)
+
+# 다중 항목 응답에서 JSON 배열만 추출 (모델이 앞뒤에 설명을 붙이는 경우 대비)
+_JSON_ARRAY_RE = re.compile(r'\[[^\[\]]*\]')
+
+# 프롬프트의 "[1] 텍스트" 번호 형식을 그대로 따라한 응답 감지
+# ("[1]" 뒤에 본문이 이어지면 점수 배열이 아니라 항목 echo)
+_NUMBERING_ECHO_RE = re.compile(r'^\s*\[\d+\]\s*\S')
+
+# 숫자가 없는 응답의 텍스트 기반 매핑 (검사 순서 유지)
+_WORD_SCORES = (
+    (('very positive', 'extremely positive', 'bullish'), 1.0),
+    (('positive', 'good', 'up'), 0.5),
+    (('neutral', 'mixed', 'unchanged'), 0.0),
+    (('negative', 'bad', 'down'), -0.5),
+    (('very negative', 'extremely negative', 'bearish'), -1.0),
+)
+
 class SentimentAnalyzer:
-    def __init__(self, ollama_host: str = "http://localhost:11434", model: str = "gpt-oss:20b"):
+    def __init__(self, ollama_host: str = "http://localhost:11434", model: str = "llama3.1:8b-instruct-q4_K_M",
+                 backend: str = "ollama"):
+        if backend not in ("ollama", "finbert"):
+            raise ValueError(f"지원하지 않는 백엔드: {backend} (ollama, finbert 중 선택)")
+
         self.ollama_host = ollama_host
         self.model = model
+        self.backend = backend
+
+        # 영속 감성 캐시 로드 (blake2b(텍스트) 키, 모델별 파일)
+        model_slug = model.replace('/', '_').replace(':', '_')
+        self._sent_cache_path = os.path.join(_SENT_CACHE_DIR, f"{model_slug}.json")
+        self._sent_cache_lock = threading.Lock()
+        self._sent_cache = self._load_sentiment_cache()
+
+        if backend == "finbert":
+            # HTTP 왕복 없이 로컬 인코더 모델로 직접 채점
+            self._init_finbert()
+            return
+
+        # keep-alive 세션 재사용 + 멀티스레드 호출을 위한 커넥션 풀 확보
         self.session = requests.Session()
-        
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=urllib3.util.Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Ollama 서버 연결 확인
         self._check_ollama_connection()
-    
+
+    def _load_sentiment_cache(self) -> dict:
+        """디스크 캐시를 로드합니다. 없거나 손상된 경우 빈 딕셔너리 반환 (만료 항목 제거)."""
+        try:
+            with open(self._sent_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        now = time.time()
+        return {k: v for k, v in cache.items() if now - v.get('ts', 0) < _SENT_CACHE_TTL}
+
+    def _save_sentiment_cache(self):
+        """디스크 캐시를 원자적으로 저장합니다 (tmp 파일 작성 후 rename)."""
+        try:
+            os.makedirs(_SENT_CACHE_DIR, exist_ok=True)
+            tmp_file = self._sent_cache_path + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._sent_cache, f)
+            os.replace(tmp_file, self._sent_cache_path)
+        except OSError:
+            pass  # 캐시 저장 실패는 치명적이지 않음
+
+    @staticmethod
+    def _sentiment_cache_key(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cached_sentiment(self, cache_key: str) -> Optional[float]:
+        with self._sent_cache_lock:
+            entry = self._sent_cache.get(cache_key)
+        return entry['score'] if entry is not None else None
+
+    def _remember_sentiment(self, cache_key: str, score: float, save: bool = True):
+        with self._sent_cache_lock:
+            self._sent_cache[cache_key] = {'score': score, 'ts': time.time()}
+            if save:
+                self._save_sentiment_cache()
+
+    def _init_finbert(self, model_name: str = "ProsusAI/finbert"):
+        """FinBERT 로컬 모델 초기화 (torch/transformers는 선택 의존성)."""
+        try:
+            import torch
+            from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        except ImportError as e:
+            raise ImportError(
+                "finbert 백엔드에는 torch와 transformers가 필요합니다: pip install torch transformers"
+            ) from e
+
+        self._torch = torch
+        self._finbert_tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        finbert_model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        if torch.cuda.is_available():
+            finbert_model = finbert_model.half().cuda()
+        self._finbert_model = finbert_model.eval()
+        self._finbert_device = next(finbert_model.parameters()).device
+
+        # 레이블 인덱스는 모델 설정에서 확인 (ProsusAI/finbert: positive/negative/neutral)
+        id2label = {int(i): label.lower() for i, label in finbert_model.config.id2label.items()}
+        self._finbert_pos_idx = next(i for i, label in id2label.items() if label.startswith('pos'))
+        self._finbert_neg_idx = next(i for i, label in id2label.items() if label.startswith('neg'))
+
+        logger.info(f"FinBERT 모델 로드 완료: {model_name} (device: {self._finbert_device})")
+
+    def _analyze_finbert_batch(self, texts: list) -> list:
+        """FinBERT로 여러 텍스트를 한 번의 forward pass로 채점.
+
+        P(positive) - P(negative)를 [-1, 1] 점수로 사용하므로 응답 파싱이나
+        재시도가 필요 없습니다.
+        """
+        torch = self._torch
+        encoded = self._finbert_tokenizer(
+            texts, padding=True, truncation=True, max_length=256, return_tensors='pt'
+        ).to(self._finbert_device)
+
+        with torch.inference_mode():
+            logits = self._finbert_model(**encoded).logits
+
+        probs = logits.softmax(-1)
+        scores = (probs[:, self._finbert_pos_idx] - probs[:, self._finbert_neg_idx]).float().cpu()
+        return scores.tolist()
+
+
     def _check_ollama_connection(self):
         """Ollama 서버 연결 상태 확인"""
         try:
             response = self.session.get(f"{self.ollama_host}/api/tags")
             if response.status_code == 200:
-                models = response.json().get('models', [])
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+                models = data.get('models', [])
                 model_names = [model['name'] for model in models]
                 if self.model not in model_names:
                     logger.warning(f"모델 {self.model}이 Ollama에 설치되어 있지 않습니다. 사용 가능한 모델: {model_names}")
@@ -41,27 +196,30 @@ class SentimentAnalyzer:
         if not text or text.strip() == "":
             logger.info("📝 빈 텍스트 입력, 중립값(0.0) 반환")
             return 0.0
-        
+
+        # 동일 텍스트 재추론 방지 (여러 티커에 걸쳐 같은 기사가 재등장)
+        cache_key = self._sentiment_cache_key(text)
+        cached_score = self._cached_sentiment(cache_key)
+        if cached_score is not None:
+            logger.info(f"💾 감성 캐시 적중: {cached_score:.4f}")
+            return cached_score
+
+        if self.backend == "finbert":
+            score = self._analyze_finbert_batch([text])[0]
+            self._remember_sentiment(cache_key, score)
+            return score
+
         # 텍스트 길이 로깅
         logger.info(f"📝 감성분석 입력 텍스트: {len(text)} 문자")
         logger.info(f"📝 텍스트 미리보기: {text[:200]}...")
         
-        # 프롬프트 설계
-        prompt = f"""
-Analyze the sentiment of the following financial news text and provide a sentiment score.
-
-Instructions:
-- Return only a numerical score between -1.0 and 1.0
-- -1.0 means very negative (bad for stock price)
-- 0.0 means neutral
-- 1.0 means very positive (good for stock price)
-- Focus on financial implications for the company
-- Consider earnings, revenue, partnerships, product launches, legal issues, etc.
-
-Text to analyze:
-{text[:2000]}  
-
-Sentiment Score:"""
+        # 프롬프트 설계: 출력은 숫자 하나뿐이므로 지시문을 한 문장으로 줄이고
+        # 입력도 800자로 제한 (추론 비용은 프롬프트+출력 토큰 수에 비례)
+        prompt = (
+            "Rate the sentiment of this financial text for the stock's price "
+            "on a scale from -1.0 (very negative) to 1.0 (very positive). "
+            f"Return only the number.\n\n{text[:800]}\n\nScore:"
+        )
         
         logger.info(f"🤖 프롬프트 생성 완료 ({len(prompt)} 문자)")
         
@@ -73,21 +231,29 @@ Sentiment Score:"""
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": "30m",  # 호출 간 모델 상주 유지 (재로딩 비용 제거)
                     "options": {
-                        "temperature": 0.1,  # 낮은 온도로 일관된 결과
-                        "top_p": 0.9,
-                        "max_tokens": 10  # 짧은 답변만 필요
+                        "temperature": 0.0,  # 결정적 출력 (숫자 하나)
+                        "top_p": 1.0,
+                        "num_predict": 8,    # Ollama의 출력 토큰 제한 파라미터 (max_tokens는 무시됨)
+                        "stop": ["\n"]       # 숫자 다음 줄부터는 생성 불필요
                     }
                 }
                 
+                if orjson is not None:
+                    body = orjson.dumps(payload)
+                else:
+                    body = json.dumps(payload).encode('utf-8')
+
                 response = self.session.post(
                     f"{self.ollama_host}/api/generate",
-                    json=payload,
+                    data=body,
+                    headers=_JSON_HEADERS,
                     timeout=60
                 )
-                
+
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content) if orjson is not None else response.json()
                     answer = result.get('response', '').strip()
                     
                     logger.info(f"🤖 모델 원본 응답: '{answer}'")
@@ -97,6 +263,7 @@ Sentiment Score:"""
                     if sentiment_score is not None:
                         logger.info(f"✅ 감성분석 성공: {sentiment_score:.4f}")
                         logger.info(f"📊 분석 결과 해석: {self._interpret_score(sentiment_score)}")
+                        self._remember_sentiment(cache_key, sentiment_score)
                         return sentiment_score
                     else:
                         logger.warning(f"⚠️  감성 점수 추출 실패 (시도 {attempt + 1})")
@@ -136,59 +303,202 @@ Sentiment Score:"""
     
     def _extract_sentiment_score(self, text: str) -> Optional[float]:
         """텍스트에서 감성 점수를 추출"""
-        import re
-        
-        # 숫자 패턴 찾기 (-1.0 ~ 1.0 범위)
-        patterns = [
-            r'(-?[01]\.?\d*)',  # -1.0, 0.5, 1.0 등
-            r'(-?[01])',        # -1, 0, 1 등
-            r'(-?\d+\.?\d*)'    # 일반적인 숫자
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
+        # 숫자 패턴 찾기 (미리 컴파일된 패턴 사용)
+        for pattern in _SCORE_PATTERNS:
+            for match in pattern.findall(text):
                 try:
                     score = float(match)
                     # -1 ~ 1 범위로 클리핑
-                    score = max(-1.0, min(1.0, score))
-                    return score
+                    return max(-1.0, min(1.0, score))
                 except ValueError:
                     continue
-        
-        # 텍스트 기반 매핑
+
+        # 텍스트 기반 매핑 (단어 목록 → 점수 테이블을 한 번만 순회)
         text_lower = text.lower()
-        if any(word in text_lower for word in ['very positive', 'extremely positive', 'bullish']):
-            return 1.0
-        elif any(word in text_lower for word in ['positive', 'good', 'up']):
-            return 0.5
-        elif any(word in text_lower for word in ['neutral', 'mixed', 'unchanged']):
-            return 0.0
-        elif any(word in text_lower for word in ['negative', 'bad', 'down']):
-            return -0.5
-        elif any(word in text_lower for word in ['very negative', 'extremely negative', 'bearish']):
-            return -1.0
-        
+        for words, score in _WORD_SCORES:
+            if any(word in text_lower for word in words):
+                return score
+
         return None
     
-    def batch_analyze_sentiment(self, texts: list, batch_size: int = 1) -> list:
-        """여러 텍스트의 감성을 배치로 분석"""
-        results = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_results = []
-            
-            for text in batch:
-                sentiment = self.analyze_sentiment(text)
-                batch_results.append(sentiment)
-                time.sleep(0.5)  # Rate limiting
-            
-            results.extend(batch_results)
-            logger.info(f"배치 {i//batch_size + 1}/{(len(texts)-1)//batch_size + 1} 완료")
-        
+    def batch_analyze_sentiment(self, texts: list, max_workers: int = 4) -> list:
+        """여러 텍스트의 감성을 동시 요청으로 분석.
+
+        Ollama는 OLLAMA_NUM_PARALLEL 설정만큼 요청을 동시에 처리하므로,
+        순차 호출 + sleep 대신 스레드 풀로 max_workers개씩 제출합니다.
+        결과 순서는 입력 순서와 동일합니다.
+        """
+        if not texts:
+            return []
+
+        # FinBERT는 캐시 미적중 텍스트만 모아 GPU forward pass 한 번으로 처리
+        if self.backend == "finbert":
+            results = [None] * len(texts)
+            pending_texts, pending_indices, pending_keys = [], [], []
+
+            for i, text in enumerate(texts):
+                if not text or text.strip() == "":
+                    results[i] = 0.0
+                    continue
+                cache_key = self._sentiment_cache_key(text)
+                cached_score = self._cached_sentiment(cache_key)
+                if cached_score is not None:
+                    results[i] = cached_score
+                else:
+                    pending_texts.append(text)
+                    pending_indices.append(i)
+                    pending_keys.append(cache_key)
+
+            if pending_texts:
+                scores = self._analyze_finbert_batch(pending_texts)
+                for i, cache_key, score in zip(pending_indices, pending_keys, scores):
+                    results[i] = score
+                    self._remember_sentiment(cache_key, score, save=False)
+                self._save_sentiment_cache()
+
+            return results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.analyze_sentiment, texts))
+
+        logger.info(f"배치 감성분석 완료: {len(results)}개 텍스트")
+        return results
+
+    def analyze_sentiment_multi(self, texts: list, group_size: int = 8, max_retries: int = 2) -> list:
+        """여러 텍스트를 번호 매긴 묶음 프롬프트 하나로 채점합니다.
+
+        호출당 고정 오버헤드(프롬프트 처리, 왕복 지연)를 K개 항목이
+        나눠 가지므로 batch_analyze_sentiment의 병렬 개별 호출보다
+        토큰/지연 비용이 낮습니다. 응답은 JSON 배열로 받아 순서대로
+        매핑하고, 파싱에 실패한 묶음은 항목별 analyze_sentiment로
+        폴백합니다. 결과 순서는 입력 순서와 동일합니다.
+        """
+        if not texts:
+            return []
+
+        # FinBERT는 이미 forward pass 한 번으로 배치 처리
+        if self.backend == "finbert":
+            return self.batch_analyze_sentiment(texts)
+
+        results = [None] * len(texts)
+        pending_indices, pending_keys = [], []
+
+        for i, text in enumerate(texts):
+            if not text or text.strip() == "":
+                results[i] = 0.0
+                continue
+            cache_key = self._sentiment_cache_key(text)
+            cached_score = self._cached_sentiment(cache_key)
+            if cached_score is not None:
+                results[i] = cached_score
+            else:
+                pending_indices.append(i)
+                pending_keys.append(cache_key)
+
+        # 캐시 미적중 항목만 group_size개씩 묶어 요청
+        for start in range(0, len(pending_indices), group_size):
+            group = pending_indices[start:start + group_size]
+            keys = pending_keys[start:start + group_size]
+
+            if len(group) == 1:
+                # 항목 1개는 묶음 이점이 없고, 번호 프롬프트의 "[1]" echo가
+                # 길이 1 숫자 배열로 오인될 수 있으므로 단일 호출로 처리
+                results[group[0]] = self.analyze_sentiment(texts[group[0]])
+                continue
+
+            scores = self._analyze_multi_group([texts[i] for i in group], max_retries)
+
+            if scores is None:
+                # 묶음 채점 실패 → 항목별 폴백 (개별 호출이 캐시에 기록)
+                logger.warning(f"⚠️  묶음 채점 실패, {len(group)}개 항목 개별 분석으로 폴백")
+                for i in group:
+                    results[i] = self.analyze_sentiment(texts[i])
+            else:
+                for i, cache_key, score in zip(group, keys, scores):
+                    results[i] = score
+                    self._remember_sentiment(cache_key, score, save=False)
+
+        self._save_sentiment_cache()
+        logger.info(f"묶음 감성분석 완료: {len(results)}개 텍스트")
         return results
 
+    def _analyze_multi_group(self, texts: list, max_retries: int) -> Optional[list]:
+        """한 묶음(K개)을 단일 Ollama 호출로 채점. 실패 시 None 반환."""
+        k = len(texts)
+        numbered = "\n".join(f"[{i}] {text[:600]}" for i, text in enumerate(texts, 1))
+        prompt = (
+            f"Rate the sentiment of each of the {k} numbered financial texts "
+            "for the stock's price on a scale from -1.0 (very negative) to 1.0 "
+            f"(very positive). Return only a JSON array of {k} numbers, in order.\n\n"
+            f"{numbered}\n\nScores:"
+        )
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": "30m",
+            "options": {
+                "temperature": 0.0,
+                "top_p": 1.0,
+                "num_predict": 8 * k + 8,  # 숫자 K개 + 구분자 여유분
+                "num_ctx": 4096            # 600자 × K 항목이 기본 2048을 넘을 수 있음
+            }
+        }
+
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode('utf-8')
+
+        for attempt in range(max_retries):
+            try:
+                response = self.session.post(
+                    f"{self.ollama_host}/api/generate",
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=120
+                )
+
+                if response.status_code == 200:
+                    result = orjson.loads(response.content) if orjson is not None else response.json()
+                    answer = result.get('response', '').strip()
+                    scores = self._parse_score_array(answer, k)
+                    if scores is not None:
+                        return scores
+                    logger.warning(f"⚠️  묶음 응답 파싱 실패 (시도 {attempt + 1}): '{answer[:200]}'")
+                else:
+                    logger.warning(f"⚠️  Ollama API 오류 (시도 {attempt + 1}): HTTP {response.status_code}")
+
+            except requests.exceptions.Timeout:
+                logger.warning(f"⏰ Ollama API 타임아웃 (시도 {attempt + 1})")
+            except Exception as e:
+                logger.warning(f"❌ 묶음 감성분석 오류 (시도 {attempt + 1}): {e}")
+
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)
+
+        return None
+
+    @staticmethod
+    def _parse_score_array(answer: str, expected: int) -> Optional[list]:
+        """응답에서 길이 expected의 숫자 JSON 배열을 추출합니다."""
+        # "[1] ..." 형태의 항목 번호 echo는 점수 배열로 오인하지 않음
+        if _NUMBERING_ECHO_RE.match(answer):
+            return None
+        match = _JSON_ARRAY_RE.search(answer)
+        if match is None:
+            return None
+        try:
+            values = json.loads(match.group(0))
+        except ValueError:
+            return None
+        if not isinstance(values, list) or len(values) != expected:
+            return None
+        if not all(isinstance(v, (int, float)) for v in values):
+            return None
+        return [max(-1.0, min(1.0, float(v))) for v in values]
+
 if __name__ == "__main__":
     analyzer = SentimentAnalyzer()
     
@@ -1,11 +1,31 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # 배치 렌더링용 백엔드 (GUI 이벤트 루프/중복 렌더 제거)
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 import numpy as np
 import os
 
-def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasdaq10_sentiment_analysis.csv"):
+plt.rcParams['figure.dpi'] = 100
+
+def _top_k(values: np.ndarray, labels, k: int, largest: bool = True) -> pd.Series:
+    """전체 정렬 없이 상위/하위 k개만 선택합니다.
+
+    O(N log N) 정렬 대신 O(N) argpartition으로 k개를 고른 뒤 그 k개만
+    정렬합니다 (largest=True면 내림차순, 아니면 오름차순 반환).
+    """
+    k = min(k, len(values))
+    if largest:
+        idx = np.argpartition(-values, k - 1)[:k]
+        idx = idx[np.argsort(-values[idx])]
+    else:
+        idx = np.argpartition(values, k - 1)[:k]
+        idx = idx[np.argsort(values[idx])]
+    return pd.Series(values[idx], index=labels[idx])
+
+def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasdaq10_sentiment_analysis.csv",
+                              interactive: bool = False):
     """감성 분석 결과를 시각화하고 분석"""
     
     # 결과 디렉토리 자동 감지 또는 직접 지정
@@ -30,19 +50,25 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
         print(f"파일을 찾을 수 없습니다: {csv_file}")
         return None, None, None, None
     
-    # 데이터 로드
-    df = pd.read_csv(csv_file, index_col=0)
+    # 데이터 로드 (float32로 다운캐스트: 메모리 절반, 집계 연산 처리량 증가)
+    df = pd.read_csv(csv_file, index_col=0).astype(np.float32)
     df.index = pd.to_datetime(df.index)
-    
+
     print(f"데이터 형태: {df.shape}")
     print(f"분석 기간: {df.index.min()} ~ {df.index.max()}")
     print(f"결과 디렉토리: {result_dir}")
-    
+
+    # 모든 통계를 NumPy 배열 한 벌에서 일괄 계산 (차트/출력마다 DataFrame 재스캔 제거)
+    arr = df.to_numpy(dtype=np.float32, copy=False)
+    all_values = arr.ravel()
+    col_mean = arr.mean(axis=0)
+    col_std = arr.std(axis=0, ddof=1)  # df.std와 동일하게 표본 표준편차
+    col_coverage = (arr != 0).mean(axis=0)
+
     # 1. 전체 감성 분포
     plt.figure(figsize=(15, 10))
     
     plt.subplot(2, 3, 1)
-    all_values = df.values.flatten()
     plt.hist(all_values, bins=50, alpha=0.7)
     plt.title('전체 감성 점수 분포')
     plt.xlabel('감성 점수')
@@ -50,7 +76,7 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     
     # 2. 일별 평균 감성
     plt.subplot(2, 3, 2)
-    daily_sentiment = df.mean(axis=1)
+    daily_sentiment = pd.Series(arr.mean(axis=1), index=df.index)
     plt.plot(daily_sentiment.index, daily_sentiment)
     plt.title('일별 평균 감성 추이')
     plt.xlabel('날짜')
@@ -59,31 +85,36 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     
     # 3. 기업별 평균 감성 (상위 10개)
     plt.subplot(2, 3, 3)
-    company_sentiment = df.mean(axis=0).sort_values(ascending=False)
-    company_sentiment.head(10).plot(kind='bar')
+    company_sentiment = pd.Series(col_mean, index=df.columns)
+    sentiment_top10 = _top_k(col_mean, df.columns, 10)
+    sentiment_top10.plot(kind='bar')
     plt.title('평균 감성 상위 10개 기업')
     plt.ylabel('평균 감성 점수')
     plt.xticks(rotation=45)
     
     # 4. 기업별 평균 감성 (하위 10개)
     plt.subplot(2, 3, 4)
-    company_sentiment.tail(10).plot(kind='bar', color='red')
+    # 하위 10개도 내림차순 표시 (가장 부정적인 기업이 마지막)
+    sentiment_bottom10 = _top_k(col_mean, df.columns, 10, largest=False)[::-1]
+    sentiment_bottom10.plot(kind='bar', color='red')
     plt.title('평균 감성 하위 10개 기업')
     plt.ylabel('평균 감성 점수')
     plt.xticks(rotation=45)
     
     # 5. 감성 변동성 (표준편차)
     plt.subplot(2, 3, 5)
-    company_volatility = df.std(axis=0).sort_values(ascending=False)
-    company_volatility.head(10).plot(kind='bar', color='orange')
+    company_volatility = pd.Series(col_std, index=df.columns)
+    volatility_top10 = _top_k(col_std, df.columns, 10)
+    volatility_top10.plot(kind='bar', color='orange')
     plt.title('감성 변동성 상위 10개 기업')
     plt.ylabel('감성 표준편차')
     plt.xticks(rotation=45)
     
     # 6. 뉴스 커버리지 (0이 아닌 값의 비율)
     plt.subplot(2, 3, 6)
-    coverage = (df != 0).mean(axis=0).sort_values(ascending=False)
-    coverage.head(10).plot(kind='bar', color='green')
+    coverage = pd.Series(col_coverage, index=df.columns)
+    coverage_top10 = _top_k(col_coverage, df.columns, 10)
+    coverage_top10.plot(kind='bar', color='green')
     plt.title('뉴스 커버리지 상위 10개 기업')
     plt.ylabel('뉴스 있는 날의 비율')
     plt.xticks(rotation=45)
@@ -92,10 +123,11 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     
     # 결과 디렉토리에 이미지 저장
     overview_file = os.path.join(result_dir, 'sentiment_analysis_overview.png')
-    plt.savefig(overview_file, dpi=300, bbox_inches='tight')
+    plt.savefig(overview_file, dpi=150, bbox_inches='tight')
     print(f"분석 개요 이미지 저장: {overview_file}")
-    plt.show()
-    
+    if interactive:
+        plt.show()
+
     # 상세 분석 출력
     print("\n=== 상세 분석 결과 ===")
     print(f"전체 평균 감성: {all_values.mean():.4f}")
@@ -105,19 +137,19 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     print(f"부정 비율: {(all_values < 0).mean()*100:.1f}%")
     
     print(f"\n가장 긍정적인 기업 Top 5:")
-    for i, (symbol, score) in enumerate(company_sentiment.head(5).items(), 1):
+    for i, (symbol, score) in enumerate(sentiment_top10.head(5).items(), 1):
         print(f"{i}. {symbol}: {score:.4f}")
     
     print(f"\n가장 부정적인 기업 Top 5:")
-    for i, (symbol, score) in enumerate(company_sentiment.tail(5).items(), 1):
+    for i, (symbol, score) in enumerate(sentiment_bottom10.tail(5).items(), 1):
         print(f"{i}. {symbol}: {score:.4f}")
     
     print(f"\n감성 변동성이 큰 기업 Top 5:")
-    for i, (symbol, vol) in enumerate(company_volatility.head(5).items(), 1):
+    for i, (symbol, vol) in enumerate(volatility_top10.head(5).items(), 1):
         print(f"{i}. {symbol}: {vol:.4f}")
     
     print(f"\n뉴스 커버리지가 높은 기업 Top 5:")
-    for i, (symbol, cov) in enumerate(coverage.head(5).items(), 1):
+    for i, (symbol, cov) in enumerate(coverage_top10.head(5).items(), 1):
         print(f"{i}. {symbol}: {cov*100:.1f}%")
     
     # 히트맵 생성 (월별 감성)
@@ -127,11 +159,12 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     df_monthly = df.resample('M').mean()
     
     # 상위 20개 기업만 표시
-    top_companies = company_sentiment.head(20).index
+    top_companies = _top_k(col_mean, df.columns, 20).index
     
-    sns.heatmap(df_monthly[top_companies].T, 
-                cmap='RdYlGn', center=0, 
+    sns.heatmap(df_monthly[top_companies].T,
+                cmap='RdYlGn', center=0,
                 annot=False, fmt='.2f',
+                rasterized=True,  # 셀을 벡터 패치 대신 한 번에 래스터화
                 cbar_kws={'label': '감성 점수'})
     plt.title('월별 감성 히트맵 (상위 20개 기업)')
     plt.xlabel('월')
@@ -140,9 +173,10 @@ def analyze_sentiment_results(result_dir: str = None, csv_filename: str = "nasda
     
     # 결과 디렉토리에 히트맵 저장
     heatmap_file = os.path.join(result_dir, 'sentiment_heatmap.png')
-    plt.savefig(heatmap_file, dpi=300, bbox_inches='tight')
+    plt.savefig(heatmap_file, dpi=150, bbox_inches='tight')
     print(f"감성 히트맵 저장: {heatmap_file}")
-    plt.show()
+    if interactive:
+        plt.show()
     
     return df, company_sentiment, company_volatility, coverage
 
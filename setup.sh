@@ -45,7 +45,7 @@ if ! command -v ollama &> /dev/null; then
     
     # 기본 모델 다운로드 (선택사항)
     echo "📥 AI 모델 다운로드 중... (시간이 오래 걸릴 수 있습니다)"
-    ollama pull llama3.1:8b
+    ollama pull llama3.1:8b-instruct-q4_K_M
 else
     echo "✅ Ollama가 이미 설치되어 있습니다."
 fi
@@ -87,9 +87,9 @@ ollama serve &
 OLLAMA_PID=$!
 sleep 5
 
-# gpt-oss:20b 모델 다운로드
-echo "4. gpt-oss:20b 모델 다운로드 중... (시간이 오래 걸릴 수 있습니다)"
-ollama pull gpt-oss:20b
+# llama3.1:8b-instruct-q4_K_M 모델 다운로드
+echo "4. llama3.1:8b-instruct-q4_K_M 모델 다운로드 중... (시간이 오래 걸릴 수 있습니다)"
+ollama pull llama3.1:8b-instruct-q4_K_M
 
 echo "5. 설정 완료!"
 echo ""
@@ -1,45 +1,43 @@
 import pandas as pd
+from pandas.tseries.holiday import USFederalHolidayCalendar
+from pandas.tseries.offsets import CustomBusinessDay
 import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import functools
+import json
 import os
 import logging
+import socket
+import struct
 from typing import Dict, List
 from tqdm import tqdm
 import time
-import subprocess
 import holidays
 
 from nasdaq100_companies import get_nasdaq100_companies
 from news_collector import NewsCollector
 from sentiment_analyzer import SentimentAnalyzer
 
+@functools.lru_cache(maxsize=1)
 def get_windows_host_ip():
-    """WSL에서 Windows 호스트 IP 주소를 자동으로 찾는 함수"""
-    try:
-        result = subprocess.run(['ip', 'route', 'show'], capture_output=True, text=True)
-        for line in result.stdout.split('\n'):
-            if 'default' in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    return parts[2]
-    except Exception as e:
-        logging.warning(f"Windows 호스트 IP 자동 감지 실패: {e}")
-    
-    # 기본값 반환
-    return "172.19.144.1"
+    """WSL에서 Windows 호스트 IP 주소를 자동으로 찾는 함수
 
-def get_windows_host_ip():
-    """WSL에서 Windows 호스트 IP 주소를 자동으로 찾는 함수"""
+    서브프로세스(`ip route show`) 포크 대신 /proc/net/route를 직접 읽어
+    기본 게이트웨이(Destination이 00000000인 행)를 파싱합니다.
+    라우팅은 실행 중 바뀌지 않으므로 결과는 1회만 계산해 캐시합니다.
+    """
     try:
-        result = subprocess.run(['ip', 'route', 'show'], capture_output=True, text=True)
-        for line in result.stdout.split('\n'):
-            if 'default' in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    return parts[2]
-    except Exception as e:
+        with open('/proc/net/route') as f:
+            next(f)  # 헤더 행 건너뜀
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3 and fields[1] == '00000000':
+                    # Gateway 컬럼은 리틀엔디언 16진수
+                    return socket.inet_ntoa(struct.pack('<L', int(fields[2], 16)))
+    except (OSError, ValueError) as e:
         logging.warning(f"Windows 호스트 IP 자동 감지 실패: {e}")
-    
+
     # 기본값 반환
     return "172.19.144.1"
 
@@ -77,8 +75,58 @@ def setup_logging(result_dir: str):
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 로그 구분선 (호출마다 재생성하지 않도록 모듈 상수로 고정)
+SEP50 = "=" * 50
+
+def interpret_sentiment_score(sentiment_score: float) -> str:
+    """감성 점수를 해석 문자열로 변환합니다 (사후 리포트용).
+
+    분석 핫패스에서는 호출하지 않고, 결과 DataFrame을 검토할 때
+    필요한 값에 대해서만 사용합니다.
+    """
+    if sentiment_score > 0.5:
+        return "매우 긍정적 🚀 (주가 상승 요인)"
+    elif sentiment_score > 0.2:
+        return "긍정적 📈 (약간의 주가 상승 요인)"
+    elif sentiment_score > -0.2:
+        return "중립적 ➡️ (주가에 중립적 영향)"
+    elif sentiment_score > -0.5:
+        return "부정적 📉 (약간의 주가 하락 요인)"
+    else:
+        return "매우 부정적 💥 (주가 하락 요인)"
+
+class RateLimiter:
+    """토큰 버킷 rate limiter (고정 sleep 대체).
+
+    버킷에 토큰이 남아 있으면 즉시 통과하고, 비어 있을 때만 리필에
+    필요한 시간만큼만 대기합니다. API별 429/Retry-After 반응은
+    NewsCollector 내부 토큰 버킷이 담당하므로 여기서는 전체 루프의
+    페이스만 조절합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # 초당 리필 토큰 수
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def acquire(self):
+        """토큰 1개를 소비합니다. 버킷이 비어 있으면 블로킹 대기."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return
+
+        wait = (1.0 - self.tokens) / self.rate
+        self.tokens -= 1.0
+        logger.info("⏳ 페이스 조절로 %.1f초 대기", wait)
+        time.sleep(wait)
+
 class StockSentimentAnalyzer:
-    def __init__(self, ollama_host: str = "http://localhost:11434", model: str = "gpt-oss:20b", result_dir: str = "."):
+    def __init__(self, ollama_host: str = "http://localhost:11434", model: str = "llama3.1:8b-instruct-q4_K_M", result_dir: str = "."):
         self.news_collector = NewsCollector(polygon_api_key="q96aIisakzHv_c7jRaoginkjRj8zGWu3")
         self.sentiment_analyzer = SentimentAnalyzer(ollama_host, model)
         self.nasdaq100_symbols, self.company_names = get_nasdaq100_companies()
@@ -86,6 +134,12 @@ class StockSentimentAnalyzer:
         
         # 미국 공휴일 설정
         self.us_holidays = holidays.US()
+
+        # 영업일 달력 (공휴일 집합을 1회만 계산해 날짜 범위를 벡터 연산으로 생성)
+        self._us_business_day = CustomBusinessDay(calendar=USFederalHolidayCalendar())
+
+        # 일 배치 페이스 조절용 (버스트 허용, 비었을 때만 대기)
+        self._rate_limiter = RateLimiter(rate=1.0, capacity=3)
         
     def is_business_day(self, date: datetime) -> bool:
         """영업일인지 확인 (주말 및 공휴일 제외)"""
@@ -101,224 +155,258 @@ class StockSentimentAnalyzer:
         
     def generate_date_range(self, start_date: str, end_date: str) -> List[datetime]:
         """날짜 범위 생성 (영업일만, 주말 및 공휴일 제외)"""
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        dates = []
-        current = start
-        while current <= end:
-            # 영업일만 추가
-            if self.is_business_day(current):
-                dates.append(current)
-            current += timedelta(days=1)
-        
-        return dates
+        # 일별 파이썬 루프 대신 pandas 영업일 달력으로 한 번에 생성
+        dates = pd.bdate_range(start_date, end_date, freq=self._us_business_day)
+        return list(dates.to_pydatetime())
     
     def analyze_single_day_company(self, symbol: str, company_name: str, target_date: datetime) -> float:
         """특정 날짜, 특정 회사의 감성 분석"""
         try:
             # 뉴스 수집
             news_items = self.news_collector.collect_company_news(company_name, symbol, target_date)
-            
-            # 뉴스 상세 로깅
-            logger.info(f"=== {symbol} ({target_date.strftime('%Y-%m-%d')}) 뉴스 분석 ===")
-            
+
             if not news_items:
-                logger.info(f"{symbol}: 뉴스 없음, 중립값(0) 반환")
-                logger.info(f"{'='*50}")
+                logger.debug("%s (%s): 뉴스 없음, 중립값(0) 반환", symbol, target_date.strftime('%Y-%m-%d'))
                 return 0.0
-            
-            # 각 뉴스 아이템 상세 로깅
-            logger.info(f"📰 수집된 뉴스 {len(news_items)}개:")
-            for i, news in enumerate(news_items, 1):
-                logger.info(f"  [{i}] 제목: {news['title']}")
-                logger.info(f"      출처: {news['source']}")
-                logger.info(f"      날짜: {news['published_date']}")
-                logger.info(f"      설명: {news['description'][:200]}{'...' if len(news['description']) > 200 else ''}")
-                logger.info(f"      링크: {news['link']}")
-                logger.info(f"      ---")
-            
-            # 뉴스 텍스트 결합
+
+            # 뉴스 텍스트를 먼저 결합하고, 비어 있으면 아이템 열거 전에 바로 반환
             news_text = self.news_collector.get_news_text(news_items)
-            
+
             if not news_text.strip():
-                logger.info(f"{symbol}: 빈 텍스트, 중립값(0) 반환")
-                logger.info(f"{'='*50}")
+                logger.debug("%s (%s): 빈 텍스트, 중립값(0) 반환", symbol, target_date.strftime('%Y-%m-%d'))
                 return 0.0
-            
-            # 결합된 뉴스 텍스트 로깅
-            logger.info(f"📝 결합된 뉴스 텍스트 (총 {len(news_text)} 문자):")
-            logger.info(f"텍스트 시작 500자: {news_text[:500]}...")
-            if len(news_text) > 1000:
-                logger.info(f"텍스트 끝 500자: ...{news_text[-500:]}")
-            logger.info(f"---")
-            
-            # 감성 분석 시작 로깅
-            logger.info(f"🤖 감성분석 시작 (모델: gpt-oss:20b)")
-            
+
+            # 뉴스 아이템 상세 로깅은 DEBUG에서만 (핫패스에서 아이템별 포맷팅/핸들러 I/O 제거)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== %s (%s) 뉴스 분석: %d개 ===", symbol, target_date.strftime('%Y-%m-%d'), len(news_items))
+                for i, news in enumerate(news_items, 1):
+                    logger.debug("  [%d] %s | %s | %s", i, news['title'], news['source'], news['link'])
+
             # 감성 분석
             sentiment_score = self.sentiment_analyzer.analyze_sentiment(news_text)
-            
-            # 감성 분석 결과 상세 로깅
-            logger.info(f"🎯 {symbol} 감성분석 완료:")
-            logger.info(f"   📊 감성 점수: {sentiment_score:.4f}")
-            logger.info(f"   📈 분석 텍스트 길이: {len(news_text):,} 문자")
-            logger.info(f"   📰 뉴스 개수: {len(news_items)}개")
-            
-            # 감성 점수 상세 해석
-            if sentiment_score > 0.5:
-                interpretation = "매우 긍정적 🚀"
-                market_impact = "주가 상승 요인"
-            elif sentiment_score > 0.2:
-                interpretation = "긍정적 📈"
-                market_impact = "약간의 주가 상승 요인"
-            elif sentiment_score > -0.2:
-                interpretation = "중립적 ➡️"
-                market_impact = "주가에 중립적 영향"
-            elif sentiment_score > -0.5:
-                interpretation = "부정적 📉"
-                market_impact = "약간의 주가 하락 요인"
-            else:
-                interpretation = "매우 부정적 💥"
-                market_impact = "주가 하락 요인"
-            
-            logger.info(f"   💡 해석: {interpretation}")
-            logger.info(f"   📊 시장 영향: {market_impact}")
-            
-            # 점수 범주별 분류
-            if sentiment_score > 0:
-                logger.info(f"   ✅ 분류: 긍정적 뉴스 (+{sentiment_score:.4f})")
-            elif sentiment_score < 0:
-                logger.info(f"   ❌ 분류: 부정적 뉴스 ({sentiment_score:.4f})")
-            else:
-                logger.info(f"   ⚪ 분류: 중립적 뉴스 (0.0000)")
-            
-            # 신뢰도 평가 (뉴스 개수 기반)
-            if len(news_items) >= 5:
-                confidence = "높음"
-            elif len(news_items) >= 3:
-                confidence = "보통"
-            else:
-                confidence = "낮음"
-            
-            logger.info(f"   🎯 신뢰도: {confidence} (뉴스 {len(news_items)}개 기반)")
-            logger.info(f"{'='*70}")
-            
+
+            # 핫패스에서는 요약 1줄만 INFO로 기록 (해석/시장영향 리포트는 사후 생성)
+            logger.info("🎯 %s (%s) 감성=%.4f (뉴스 %d개, %d자)",
+                        symbol, target_date.strftime('%Y-%m-%d'),
+                        sentiment_score, len(news_items), len(news_text))
+
             return sentiment_score
-            
+
         except Exception as e:
-            error_msg = f"{symbol} ({target_date.strftime('%Y-%m-%d')}) 분석 오류: {e}"
-            logger.error(error_msg)
-            logger.error(f"{'='*50}")
+            logger.error("%s (%s) 분석 오류: %s", symbol, target_date.strftime('%Y-%m-%d'), e)
             return 0.0
     
+    def collect_day_news_text(self, symbol: str, company_name: str, target_date: datetime):
+        """특정 날짜, 특정 회사의 뉴스를 수집해 (결합 텍스트, 뉴스 수)를 반환합니다."""
+        news_items = self.news_collector.collect_company_news(company_name, symbol, target_date)
+        if not news_items:
+            return "", 0
+        return self.news_collector.get_news_text(news_items), len(news_items)
+
+    def analyze_day(self, symbols: List[str], target_date: datetime,
+                    collect_workers: int = 5, sentiment_workers: int = 4,
+                    sentiment_group_size: int = 8) -> Dict[str, float]:
+        """하루치 전체 심볼을 수집·감성분석 파이프라인으로 처리합니다.
+
+        뉴스 수집(Polygon I/O)과 감성분석(Ollama I/O)은 심볼 간에
+        독립이므로 두 스레드 풀로 겹쳐 실행합니다: 수집이 끝난 심볼은
+        sentiment_group_size개씩 모이는 즉시 묶음 프롬프트 한 번으로
+        채점(analyze_sentiment_multi)되어 LLM 호출 수가 심볼 수가 아닌
+        묶음 수로 줄고, 수집과 채점의 지연이 서로 가려집니다.
+        (수집 페이스는 수집기의 토큰 버킷이 유지)
+        """
+        date_str = target_date.strftime('%Y-%m-%d')
+        scores: Dict[str, float] = {}
+
+        # Polygon 백엔드는 일괄 수집으로 당일 캐시를 먼저 채움: 티커당
+        # 1회(심볼 수만큼)의 호출 대신 페이징 수집 한 번으로 끝나고,
+        # 이후 심볼별 수집은 네트워크 없이 캐시 조회만 수행
+        if self.news_collector.backend == 'polygon':
+            self.news_collector.fetch_day_news(target_date)
+
+        def collect_one(symbol: str):
+            return self.collect_day_news_text(symbol, self.company_names[symbol], target_date)
+
+        pending_symbols: List[str] = []
+        pending_texts: List[str] = []
+        score_futures: Dict = {}
+
+        with ThreadPoolExecutor(max_workers=collect_workers) as collectors, \
+                ThreadPoolExecutor(max_workers=sentiment_workers) as scorers:
+            collect_futures = {collectors.submit(collect_one, symbol): symbol for symbol in symbols}
+
+            def submit_group():
+                """모인 묶음을 LLM 호출 1회(analyze_sentiment_multi)로 제출."""
+                if pending_texts:
+                    future = scorers.submit(
+                        self.sentiment_analyzer.analyze_sentiment_multi, list(pending_texts))
+                    score_futures[future] = list(pending_symbols)
+                    pending_symbols.clear()
+                    pending_texts.clear()
+
+            # 수집 완료 순서대로 묶음을 채워 감성분석 제출 (수집 ↔ 분석 중첩)
+            for future in as_completed(collect_futures):
+                symbol = collect_futures[future]
+                try:
+                    news_text, news_count = future.result()
+                except Exception as e:
+                    logger.error("%s (%s) 뉴스 수집 오류: %s", symbol, date_str, e)
+                    scores[symbol] = 0.0
+                    continue
+
+                if not news_text.strip():
+                    logger.info("%s (%s): 뉴스 없음, 중립값(0) 반환", symbol, date_str)
+                    scores[symbol] = 0.0
+                else:
+                    logger.info("📰 %s (%s): 뉴스 %d개, 텍스트 %s 문자", symbol, date_str, news_count, format(len(news_text), ','))
+                    pending_symbols.append(symbol)
+                    pending_texts.append(news_text)
+                    if len(pending_texts) >= sentiment_group_size:
+                        submit_group()
+
+            # 마지막 미만 묶음 제출
+            submit_group()
+
+            for future in as_completed(score_futures):
+                group_symbols = score_futures[future]
+                try:
+                    group_scores = future.result()
+                except Exception as e:
+                    logger.error("(%s) 묶음 감성분석 오류: %s", date_str, e)
+                    group_scores = [0.0] * len(group_symbols)
+                for symbol, score in zip(group_symbols, group_scores):
+                    scores[symbol] = score
+                    logger.info("🎯 %s (%s) 감성 점수: %.4f", symbol, date_str, score)
+
+        return scores
+
     def analyze_period(self, start_date: str, end_date: str, output_filename: str = "nasdaq100_sentiment.csv") -> pd.DataFrame:
         """기간 동안의 모든 기업 감성 분석"""
         dates = self.generate_date_range(start_date, end_date)
         
-        # 결과 디렉토리에 파일 저장
+        # 결과 디렉토리에 파일 저장 (중간 저장은 append 전용 JSONL 체크포인트)
         output_file = os.path.join(self.result_dir, output_filename)
-        temp_file = os.path.join(self.result_dir, f"{output_filename}.temp")
-        
+        checkpoint_file = os.path.join(self.result_dir, f"{output_filename}.checkpoint.jsonl")
+
         logger.info(f"분석 기간: {start_date} ~ {end_date} ({len(dates)}일)")
         logger.info(f"분석 대상: 나스닥 100 기업 {len(self.nasdaq100_symbols)}개")
         logger.info(f"총 분석 작업: {len(dates) * len(self.nasdaq100_symbols)}개")
         logger.info(f"결과 저장 위치: {output_file}")
         
-        # 결과 데이터프레임 초기화
-        df = pd.DataFrame(index=[d.strftime('%Y-%m-%d') for d in dates], 
-                         columns=self.nasdaq100_symbols)
-        df = df.fillna(0.0)  # 기본값 0으로 설정
-        
-        # 진행상황 추적
-        total_tasks = len(dates) * len(self.nasdaq100_symbols)
-        completed_tasks = 0
-        
-        with tqdm(total=total_tasks, desc="감성 분석 진행") as pbar:
-            for date in dates:
-                date_str = date.strftime('%Y-%m-%d')
-                logger.info(f"날짜 {date_str} 분석 시작")
-                
-                for symbol in self.nasdaq100_symbols:
-                    company_name = self.company_names[symbol]
-                    
-                    try:
-                        sentiment_score = self.analyze_single_day_company(symbol, company_name, date)
-                        df.loc[date_str, symbol] = sentiment_score
-                        
-                        # 중간 저장 (10개 작업마다)
-                        if completed_tasks % 10 == 0:
-                            df.to_csv(temp_file)
-                        
-                    except Exception as e:
-                        logger.error(f"{symbol} ({date_str}) 처리 오류: {e}")
-                        df.loc[date_str, symbol] = 0.0
-                    
-                    completed_tasks += 1
-                    pbar.update(1)
-                    
-                    # Rate limiting (너무 빠른 요청 방지)
-                    time.sleep(1)
-                
-                # 하루 완료 후 저장
-                df.to_csv(temp_file)
-                logger.info(f"날짜 {date_str} 분석 완료")
-        
-        # 최종 저장
+        # 결과는 (날짜 × 심볼) float32 행렬에 위치 기반으로 기록하고
+        # DataFrame은 마지막에 한 번만 구성 (셀 단위 .loc 라벨 인덱싱 제거)
+        symbols = list(self.nasdaq100_symbols)
+        # 날짜 문자열은 벡터화된 strftime 한 번으로 일괄 생성
+        date_strs = pd.DatetimeIndex(dates).strftime('%Y-%m-%d').tolist()
+        # 열 우선(Fortran) 배치: 요약 통계의 심볼별(열 방향) 집계가
+        # 연속 메모리 스캔이 되고, pandas가 복사 없이 그대로 감쌈
+        scores_arr = np.zeros((len(dates), len(symbols)), dtype=np.float32, order='F')
+        total_tasks = len(dates) * len(symbols)
+
+        # 기존 체크포인트 복원 (완료된 날짜는 재분석하지 않음)
+        completed_days = self._load_checkpoint(checkpoint_file)
+        if completed_days:
+            logger.info(f"체크포인트에서 {len(completed_days)}일치 결과 복원: {checkpoint_file}")
+
+        # 체크포인트는 라인 버퍼링 append 핸들 하나로 유지
+        # (전체 CSV를 매번 다시 쓰는 대신 레코드당 O(1) 쓰기)
+        with open(checkpoint_file, 'a', buffering=1, encoding='utf-8') as checkpoint, \
+                tqdm(total=total_tasks, desc="감성 분석 진행") as pbar:
+            for row, (date, date_str) in enumerate(zip(dates, date_strs)):
+                # 체크포인트에 하루치가 전부 있으면 복원만 하고 건너뜀
+                done = completed_days.get(date_str)
+                if done is not None and all(symbol in done for symbol in symbols):
+                    scores_arr[row] = [done[symbol] for symbol in symbols]
+                    pbar.update(len(symbols))
+                    continue
+
+                logger.info("날짜 %s 분석 시작", date_str)
+
+                # 하루치 전체를 배치로 처리 (수집 → 배치 감성분석)
+                scores = self.analyze_day(symbols, date)
+                for col, symbol in enumerate(symbols):
+                    score = scores.get(symbol, 0.0)
+                    scores_arr[row, col] = score
+                    checkpoint.write(json.dumps({'date': date_str, 'symbol': symbol, 'score': score}) + '\n')
+                pbar.update(len(symbols))
+                logger.info("날짜 %s 분석 완료", date_str)
+
+                # Rate limiting (작업 단위가 아닌 배치 단위로, 필요할 때만 대기)
+                self._rate_limiter.acquire()
+
+        # 최종 저장 (행렬에서 DataFrame을 한 번만 구성)
+        df = pd.DataFrame(scores_arr, index=date_strs, columns=symbols)
         df.to_csv(output_file)
         logger.info(f"분석 완료. 결과 저장: {output_file}")
-        
-        # 임시 파일 삭제
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-        
+
+        # 체크포인트 삭제
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+
         return df
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: str) -> Dict[str, Dict[str, float]]:
+        """JSONL 체크포인트를 {날짜: {심볼: 점수}}로 로드합니다."""
+        completed: Dict[str, Dict[str, float]] = {}
+        if not os.path.exists(checkpoint_file):
+            return completed
+
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    completed.setdefault(record['date'], {})[record['symbol']] = record['score']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"체크포인트 로드 실패, 처음부터 분석합니다: {e}")
+            return {}
+
+        return completed
     
     def load_and_resume(self, output_filename: str, start_date: str, end_date: str) -> pd.DataFrame:
         """기존 분석 결과를 로드하고 미완료 부분을 이어서 분석"""
         output_file = os.path.join(self.result_dir, output_filename)
-        temp_file = os.path.join(self.result_dir, f"{output_filename}.temp")
-        
-        if os.path.exists(temp_file):
-            logger.info(f"임시 파일에서 분석 재개: {temp_file}")
-            df = pd.read_csv(temp_file, index_col=0)
-        elif os.path.exists(output_file):
-            logger.info(f"기존 파일에서 분석 재개: {output_file}")
+
+        if os.path.exists(output_file):
             df = pd.read_csv(output_file, index_col=0)
+
+            # 전체 기간이 포함되어 있으면 그대로 사용
+            dates = self.generate_date_range(start_date, end_date)
+            date_strs = pd.DatetimeIndex(dates).strftime('%Y-%m-%d')
+            if all(date_str in df.index for date_str in date_strs):
+                logger.info("모든 분석이 완료되었습니다.")
+                return df
+
+            logger.info(f"기존 파일에 누락된 날짜가 있어 분석 재개: {output_file}")
         else:
-            logger.info("새로운 분석 시작")
-            return self.analyze_period(start_date, end_date, output_filename)
-        
-        # 미완료 부분 찾기
-        dates = self.generate_date_range(start_date, end_date)
-        
-        for date in dates:
-            date_str = date.strftime('%Y-%m-%d')
-            
-            if date_str not in df.index:
-                logger.info(f"누락된 날짜 {date_str}부터 분석 재개")
-                # 나머지 기간 분석
-                remaining_start = date_str
-                remaining_df = self.analyze_period(remaining_start, end_date, output_filename)
-                return remaining_df
-        
-        logger.info("모든 분석이 완료되었습니다.")
-        return df
+            logger.info("새로운 분석 시작 (JSONL 체크포인트가 있으면 이어서 진행)")
+
+        # analyze_period가 체크포인트에서 완료된 날짜를 복원하고 이어서 분석
+        return self.analyze_period(start_date, end_date, output_filename)
     
     def get_summary_statistics(self, df: pd.DataFrame) -> Dict:
         """분석 결과 요약 통계"""
+        # 불리언 DataFrame을 통계마다 다시 만들지 않고 NumPy 배열 한 벌에서 일괄 계산
+        arr = df.to_numpy(dtype=np.float32, copy=False)
+        zero_count = int(np.count_nonzero(arr == 0))
+        positive_count = int(np.count_nonzero(arr > 0))
+        negative_count = arr.size - zero_count - positive_count
+
         summary = {
             'total_days': len(df),
             'total_companies': len(df.columns),
-            'total_analysis_points': df.size,
-            'zero_values_count': (df == 0).sum().sum(),
-            'positive_sentiment_ratio': (df > 0).sum().sum() / df.size,
-            'negative_sentiment_ratio': (df < 0).sum().sum() / df.size,
-            'neutral_sentiment_ratio': (df == 0).sum().sum() / df.size,
-            'mean_sentiment_by_company': df.mean().to_dict(),
-            'mean_sentiment_by_date': df.mean(axis=1).to_dict()
+            'total_analysis_points': int(arr.size),
+            'zero_values_count': zero_count,
+            'positive_sentiment_ratio': positive_count / arr.size,
+            'negative_sentiment_ratio': negative_count / arr.size,
+            'neutral_sentiment_ratio': zero_count / arr.size,
+            'mean_sentiment_by_company': dict(zip(df.columns, arr.mean(axis=0).tolist())),
+            'mean_sentiment_by_date': dict(zip(df.index, arr.mean(axis=1).tolist()))
         }
-        
+
         return summary
 
 def main():
@@ -346,7 +434,7 @@ def main():
     print("테스트 대상: 나스닥 상위 10개 기업")
     print(f"결과 저장 위치: {result_dir}/")
     print("Windows에서 Ollama가 실행 중인지 확인해주세요.")
-    print("모델 다운로드: ollama pull gpt-oss:20b")
+    print("모델 다운로드: ollama pull llama3.1:8b-instruct-q4_K_M")
     input("준비가 되면 Enter를 눌러주세요...")
     
     # 분석기 초기화
@@ -359,12 +447,12 @@ def main():
     print(f"선택된 기업: {', '.join(top_10_symbols)}")
     
     # 분석 정보 로깅
-    logger.info("="*50)
+    logger.info(SEP50)
     logger.info("나스닥 10 주식 감성분석 시작")
     logger.info(f"분석 기간: {START_DATE} ~ {END_DATE}")
     logger.info(f"분석 대상: {', '.join(top_10_symbols)}")
     logger.info(f"결과 디렉토리: {result_dir}")
-    logger.info("="*50)
+    logger.info(SEP50)
     
     # 분석 실행 (재개 가능)
     try:
@@ -392,7 +480,6 @@ def main():
         logger.info(summary_text)
         
         # 요약 통계를 JSON 파일로 저장
-        import json
         summary_file = os.path.join(result_dir, "analysis_summary.json")
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
@@ -402,7 +489,7 @@ def main():
         
     except KeyboardInterrupt:
         logger.info("사용자에 의해 분석이 중단되었습니다.")
-        print("분석이 중단되었습니다. 임시 파일이 저장되어 나중에 재개할 수 있습니다.")
+        print("분석이 중단되었습니다. 체크포인트가 저장되어 나중에 재개할 수 있습니다.")
     except Exception as e:
         logger.error(f"분석 중 오류 발생: {e}")
         print(f"오류 발생: {e}")
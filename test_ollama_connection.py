@@ -6,6 +6,19 @@ WSL에서 Windows Ollama 서버 연결 테스트
 import subprocess
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 모듈 레벨 세션: keep-alive로 호출마다 TCP 핸드셰이크를 반복하지 않고,
+# 429/5xx는 백오프와 함께 자동 재시도 (sentiment_analyzer의 세션 설정과 동일)
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
 
 def get_windows_host_ip():
     """WSL에서 Windows 호스트 IP 주소를 자동으로 찾는 함수"""
@@ -31,7 +44,7 @@ def test_ollama_connection():
     
     # 1. 서버 연결 테스트
     try:
-        response = requests.get(f"{ollama_host}/api/tags", timeout=10)
+        response = SESSION.get(f"{ollama_host}/api/tags", timeout=10)
         if response.status_code == 200:
             models = response.json().get('models', [])
             print(f"✅ Ollama 서버 연결 성공!")
@@ -46,12 +59,12 @@ def test_ollama_connection():
         print(f"❌ Ollama 서버 연결 오류: {e}")
         return False
     
-    # 2. gpt-oss:20b 모델 테스트
+    # 2. llama3.1:8b-instruct-q4_K_M 모델 테스트
     try:
         test_prompt = "Analyze the sentiment of this text: 'Apple reports strong quarterly earnings.' Return only a number between -1 and 1."
         
         payload = {
-            "model": "gpt-oss:20b",
+            "model": "llama3.1:8b-instruct-q4_K_M",
             "prompt": test_prompt,
             "stream": False,
             "options": {
@@ -61,7 +74,7 @@ def test_ollama_connection():
         }
         
         print("\n🔍 모델 테스트 중...")
-        response = requests.post(f"{ollama_host}/api/generate", json=payload, timeout=60)
+        response = SESSION.post(f"{ollama_host}/api/generate", json=payload, timeout=60)
         
         if response.status_code == 200:
             result = response.json()
@@ -89,4 +102,4 @@ if __name__ == "__main__":
         print("\n❌ 테스트 실패. 다음을 확인해주세요:")
         print("1. Windows에서 Ollama가 실행 중인가?")
         print("2. Windows 방화벽이 11434 포트를 허용하는가?")
-        print("3. gpt-oss:20b 모델이 설치되어 있는가?")
+        print("3. llama3.1:8b-instruct-q4_K_M 모델이 설치되어 있는가?")